@@ -1,8 +1,12 @@
 import logging
 import os
+from logging.handlers import RotatingFileHandler
 from datetime import datetime
 from typing import Optional
 
+# Directory holding the log files (this package's own directory)
+DEBUG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'debug')
+
 def setup_logger(name: str = "scraper", level: int = logging.INFO) -> logging.Logger:
     """Set up and return a logger with the specified name and level"""
     logger = logging.getLogger(name)
@@ -11,11 +15,12 @@ def setup_logger(name: str = "scraper", level: int = logging.INFO) -> logging.Lo
     # Check if the logger already has handlers to avoid duplicate handlers
     if not logger.handlers:
         # Create debug directory if it doesn't exist
-        debug_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'debug')
-        os.makedirs(debug_dir, exist_ok=True)
+        os.makedirs(DEBUG_DIR, exist_ok=True)
         
-        # File handler
-        file_handler = logging.FileHandler(os.path.join(debug_dir, f'{name}.log'))
+        # File handler (rotated so long-running sessions don't grow the log without bound)
+        file_handler = RotatingFileHandler(
+            os.path.join(DEBUG_DIR, f'{name}.log'), maxBytes=1_000_000, backupCount=3
+        )
         file_handler.setLevel(level)
         
         # Console handler
@@ -40,6 +40,9 @@ def main() -> None:
     # Set up logger
     logger = setup_logger("test_scrapers")
     
+    # Keep each browser open for inspection until Enter is pressed
+    os.environ.setdefault('SCRAPER_HOLD_ON_EXIT', '1')
+    
     while True:
         print("\nCommercial Real Estate Scraper")
         print("=" * 30)
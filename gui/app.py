@@ -4,13 +4,13 @@ Now using Windows Task Scheduler instead of Windows Service.
 """
 
 import os
+import re
 import sys
 import json
-import time
+import hashlib
 import logging
 from datetime import datetime, timedelta
-from pathlib import Path
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import ctypes
 
@@ -28,16 +28,18 @@ from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QLineEdit, QCheckBox, QComboBox, QPushButton, QTabWidget,
     QListWidget, QListWidgetItem, QProgressBar, QSpinBox, QTimeEdit,
-    QGroupBox, QFormLayout, QFileDialog, QMessageBox, QTextEdit,
-    QScrollArea, QSplitter, QFrame, QSizePolicy
+    QGroupBox, QFormLayout, QFileDialog, QMessageBox, QPlainTextEdit,
+    QScrollArea, QSplitter, QFrame, QSizePolicy, QAbstractSpinBox
 )
-from PyQt5.QtCore import Qt, QTimer, QTime, pyqtSignal, QThread
-from PyQt5.QtGui import QColor, QIcon, QFont, QPalette
+from PyQt5.QtCore import Qt, QCoreApplication, QEvent, QTimer, QTime, pyqtSignal, QThread
+from PyQt5.QtGui import QColor, QIcon, QFont, QPalette, QIntValidator
 
-# Import project modules
+# Import project modules (the scraper stack and email sender are imported when first used,
+# so Selenium/BeautifulSoup don't load before the window appears)
 from task_scheduler.task_manager import TaskSchedulerManager
-from scraper.scraper_manager import ScraperManager
-from utils.email_sender import EmailSender
+from utils.file_utils import write_json_atomic, write_text_atomic
+from utils.search_utils import parse_price, total_count
+from utils.email_sender import format_email_body, format_results_body
 # Configuration constants
 if getattr(sys, 'frozen', False):
     # Running as executable - use AppData for self-contained behavior
@@ -46,9 +48,18 @@ if getattr(sys, 'frozen', False):
     CONFIG_DIR = appdata_dir
 else:
     # Running as script - use directory containing this file's parent
-    CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config")
+    CONFIG_DIR = os.path.join(parent_dir, "config")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 
+# Quiet period after the last field edit before the configuration is written
+AUTO_SAVE_DELAY_MS = 500
+
+# Formatted listings kept for reuse between the results tab and the email body
+LISTING_TEXT_CACHE_SIZE = 4096
+
+# Emoji prefixes used in the results tab that are dropped from emails
+EMOJI_PREFIX_PATTERN = re.compile("(?:💰|🏢|📐|📍|📝|🔗|📅) ")
+
 # Default configuration
 DEFAULT_CONFIG = {
     'property_types': ['Office', 'Retail', 'Industrial', 'Multifamily'],
@@ -64,15 +75,659 @@ DEFAULT_CONFIG = {
     'hide_terminal': True
 }
 
+# Modern dark stylesheet with proper contrast
+DARK_STYLESHEET = """
+    /* Main Window */
+    QMainWindow {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    
+    /* Input Fields - Dark background with white text */
+    QLineEdit, QSpinBox, QTimeEdit, QComboBox {
+        background-color: #3c3c3c;
+        border: 2px solid #555555;
+        border-radius: 6px;
+        padding: 8px;
+        color: #ffffff;
+        font-size: 13px;
+        font-weight: normal;
+        selection-background-color: #6EA6BC;
+        min-height: 20px;
+        max-height: 36px;
+    }
+    
+    QLineEdit:focus, QSpinBox:focus, QTimeEdit:focus, QComboBox:focus {
+        border-color: #6EA6BC;
+        background-color: #404040;
+        outline: none;
+    }
+    
+    QLineEdit:hover, QSpinBox:hover, QTimeEdit:hover, QComboBox:hover {
+        border-color: #6EA6BC;
+    }
+    
+    QLineEdit::placeholder {
+        color: #888888;
+        font-style: italic;
+    }
+    
+    /* Completely hide SpinBox and TimeEdit buttons */
+    QSpinBox::up-button, QSpinBox::down-button, 
+    QTimeEdit::up-button, QTimeEdit::down-button {
+        width: 0px;
+        height: 0px;
+        border: none;
+        background: transparent;
+        subcontrol-origin: border;
+        subcontrol-position: right;
+    }
+    
+    QSpinBox::up-arrow, QSpinBox::down-arrow, 
+    QTimeEdit::up-arrow, QTimeEdit::down-arrow {
+        width: 0px;
+        height: 0px;
+        border: none;
+        background: transparent;
+    }
+    
+    /* ComboBox dropdown styling */
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+        background: transparent;
+    }
+    
+    QComboBox::down-arrow {
+        image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTMgNC41TDYgNy41TDkgNC41IiBzdHJva2U9IiNmZmZmZmYiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
+        width: 12px;
+        height: 12px;
+    }
+    
+    QComboBox QAbstractItemView {
+        background-color: #3c3c3c;
+        border: 2px solid #555555;
+        border-radius: 6px;
+        color: #ffffff;
+        selection-background-color: #6EA6BC;
+        outline: none;
+    }
+    
+    /* Buttons */
+    QPushButton {
+        background-color: #6EA6BC;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 16px;
+        color: white;
+        font-weight: 500;
+        font-size: 11px;
+        min-height: 20px;
+    }
+    
+    QPushButton:hover {
+        background-color: #5A94A8;
+    }
+    
+    QPushButton:pressed {
+        background-color: #4A7A8A;
+    }
+    
+    QPushButton:disabled {
+        background-color: #555555;
+        color: #888888;
+    }
+    
+    /* Checkboxes */
+    QCheckBox {
+        color: #ffffff;
+        font-size: 11px;
+        spacing: 8px;
+    }
+    
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 3px;
+        border: 2px solid #555555;
+        background-color: #3c3c3c;
+    }
+    
+    QCheckBox::indicator:checked {
+        background-color: #6EA6BC;
+        border-color: #ffffff;
+        image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
+    }
+    
+    QCheckBox::indicator:hover {
+        border-color: #6EA6BC;
+    }
+    
+    /* Group Boxes */
+    QGroupBox {
+        font-weight: 600;
+        font-size: 12px;
+        color: #ffffff;
+        border: 2px solid #555555;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding: 16px;  /* Increased padding */
+        background-color: #323232;
+    }
+    
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px 0 8px;
+        color: #ffffff;
+        background-color: #323232;
+    }
+    
+    /* Tabs */
+    QTabWidget::pane {
+        border: 2px solid #555555;
+        border-radius: 6px;
+        background-color: #2b2b2b;
+        margin-top: -1px;
+    }
+    
+    QTabBar::tab {
+        background-color: #3c3c3c;
+        border: 2px solid #555555;
+        border-bottom: none;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+        padding: 10px 32px;  /* Reverted padding */
+        margin-right: 2px;
+        color: #ffffff;
+        font-weight: 500;
+        min-width: 120px;  /* Increased min-width to prevent text cutoff */
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #2b2b2b;
+        border-color: #555555;
+        border-bottom: 2px solid #2b2b2b;
+    }
+    
+    QTabBar::tab:hover:!selected {
+        background-color: #484848;
+    }
+    
+    /* Labels */
+    QLabel {
+        color: #ffffff;
+        font-size: 11px;
+    }
+    
+    /* Text Areas */
+    QTextEdit, QPlainTextEdit {
+        background-color: #3c3c3c;
+        border: 2px solid #555555;
+        border-radius: 6px;
+        color: #ffffff;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 10px;
+        selection-background-color: #6EA6BC;
+    }
+    
+    /* Scrollbars */
+    QScrollBar:vertical {
+        background-color: #3c3c3c;
+        width: 12px;
+        border-radius: 6px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #555555;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background-color: #666666;
+    }
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+    }
+    
+
+    
+    /* Message Boxes and Dialogs */
+    QMessageBox {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    
+    QMessageBox QLabel {
+        color: #ffffff;
+        background-color: transparent;
+    }
+    
+    QMessageBox QPushButton {
+        background-color: #6EA6BC;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        color: white;
+        font-weight: 500;
+        min-width: 80px;
+    }
+    
+    QMessageBox QPushButton:hover {
+        background-color: #5A94A8;
+    }
+    
+    QMessageBox QPushButton:pressed {
+        background-color: #4A7A8A;
+    }
+    
+    /* File Dialog */
+    QFileDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    
+    QFileDialog QLabel {
+        color: #ffffff;
+    }
+    
+    QFileDialog QLineEdit {
+        background-color: #3c3c3c;
+        border: 2px solid #555555;
+        border-radius: 6px;
+        padding: 8px;
+        color: #ffffff;
+    }
+    
+    /* Scroll Areas */
+    QScrollArea {
+        background-color: #2b2b2b;
+        border: none;
+    }
+    
+    QScrollArea > QWidget > QWidget {
+        background-color: #2b2b2b;
+    }
+"""
+
+# Modern light stylesheet
+LIGHT_STYLESHEET = """
+    /* Main Window */
+    QMainWindow {
+        background-color: #f5f5f5;
+        color: #333333;
+    }
+    
+    /* Input Fields */
+    QLineEdit, QSpinBox, QTimeEdit, QComboBox {
+        background-color: #ffffff;
+        border: 2px solid #cccccc;
+        border-radius: 6px;
+        padding: 8px;
+        color: #333333;
+        font-size: 13px;
+        font-weight: normal;
+        selection-background-color: #6EA6BC;
+        min-height: 20px;
+        max-height: 36px;
+    }
+    
+    QLineEdit:focus, QSpinBox:focus, QTimeEdit:focus, QComboBox:focus {
+        border-color: #6EA6BC;
+        background-color: #ffffff;
+        outline: none;
+    }
+    
+    QLineEdit:hover, QSpinBox:hover, QTimeEdit:hover, QComboBox:hover {
+        border-color: #6EA6BC;
+    }
+    
+    QLineEdit::placeholder {
+        color: #888888;
+        font-style: italic;
+    }
+    
+    /* Completely hide SpinBox and TimeEdit buttons */
+    QSpinBox::up-button, QSpinBox::down-button, 
+    QTimeEdit::up-button, QTimeEdit::down-button {
+        width: 0px;
+        height: 0px;
+        border: none;
+        background: transparent;
+        subcontrol-origin: border;
+        subcontrol-position: right;
+    }
+    
+    QSpinBox::up-arrow, QSpinBox::down-arrow, 
+    QTimeEdit::up-arrow, QTimeEdit::down-arrow {
+        width: 0px;
+        height: 0px;
+        border: none;
+        background: transparent;
+    }
+    
+    /* ComboBox dropdown styling */
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+        background: transparent;
+    }
+    
+    QComboBox::down-arrow {
+        image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTMgNC41TDYgNy41TDkgNC41IiBzdHJva2U9IiMzMzMzMzMiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
+        width: 12px;
+        height: 12px;
+    }
+    
+    QComboBox QAbstractItemView {
+        background-color: #ffffff;
+        border: 2px solid #cccccc;
+        border-radius: 6px;
+        color: #333333;
+        selection-background-color: #6EA6BC;
+        outline: none;
+    }
+    
+    /* Buttons */
+    QPushButton {
+        background-color: #6EA6BC;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 16px;
+        color: white;
+        font-weight: 500;
+        font-size: 11px;
+        min-height: 20px;
+    }
+    
+    QPushButton:hover {
+        background-color: #5A94A8;
+    }
+    
+    QPushButton:pressed {
+        background-color: #4A7A8A;
+    }
+    
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #888888;
+    }
+    
+    /* Checkboxes */
+    QCheckBox {
+        color: #333333;
+        font-size: 11px;
+        spacing: 8px;
+    }
+    
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 3px;
+        border: 2px solid #cccccc;
+        background-color: #ffffff;
+    }
+    
+    QCheckBox::indicator:checked {
+        background-color: #6EA6BC;
+        border-color: #333333;
+        image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
+    }
+    
+    QCheckBox::indicator:hover {
+        border-color: #6EA6BC;
+    }
+    
+    /* Group Boxes */
+    QGroupBox {
+        font-weight: 600;
+        font-size: 12px;
+        color: #333333;
+        border: 2px solid #cccccc;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding: 16px;  /* Increased padding */
+        background-color: #ffffff;
+    }
+    
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px 0 8px;
+        color: #333333;
+        background-color: #ffffff;
+    }
+    
+    /* Tabs */
+    QTabWidget::pane {
+        border: 2px solid #cccccc;
+        border-radius: 6px;
+        background-color: #f5f5f5;
+        margin-top: -1px;
+    }
+    
+    QTabBar::tab {
+        background-color: #ffffff;
+        border: 2px solid #cccccc;
+        border-bottom: none;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+        padding: 10px 32px;  /* Reverted padding */
+        margin-right: 2px;
+        color: #333333;
+        font-weight: 500;
+        min-width: 120px;  /* Increased min-width to prevent text cutoff */
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #f5f5f5;
+        border-color: #cccccc;
+        border-bottom: 2px solid #f5f5f5;
+    }
+    
+    QTabBar::tab:hover:!selected {
+        background-color: #e8e8e8;
+    }
+    
+    /* Labels */
+    QLabel {
+        color: #333333;
+        font-size: 11px;
+    }
+    
+    /* Text Areas */
+    QTextEdit, QPlainTextEdit {
+        background-color: #ffffff;
+        border: 2px solid #cccccc;
+        border-radius: 6px;
+        color: #333333;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 10px;
+        selection-background-color: #6EA6BC;
+    }
+    
+    /* Scrollbars */
+    QScrollBar:vertical {
+        background-color: #ffffff;
+        width: 12px;
+        border-radius: 6px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #cccccc;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background-color: #999999;
+    }
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+    }
+    
+
+    
+    /* Message Boxes and Dialogs */
+    QMessageBox {
+        background-color: #f5f5f5;
+        color: #333333;
+    }
+    
+    QMessageBox QLabel {
+        color: #333333;
+        background-color: transparent;
+    }
+    
+    QMessageBox QPushButton {
+        background-color: #6EA6BC;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        color: white;
+        font-weight: 500;
+        min-width: 80px;
+    }
+    
+    QMessageBox QPushButton:hover {
+        background-color: #5A94A8;
+    }
+    
+    QMessageBox QPushButton:pressed {
+        background-color: #4A7A8A;
+    }
+    
+    /* File Dialog */
+    QFileDialog {
+        background-color: #f5f5f5;
+        color: #333333;
+    }
+    
+    QFileDialog QLabel {
+        color: #333333;
+    }
+    
+    QFileDialog QLineEdit {
+        background-color: #ffffff;
+        border: 2px solid #cccccc;
+        border-radius: 6px;
+        padding: 8px;
+        color: #333333;
+    }
+    
+    /* Scroll Areas */
+    QScrollArea {
+        background-color: #f5f5f5;
+        border: none;
+    }
+    
+    QScrollArea > QWidget > QWidget {
+        background-color: #f5f5f5;
+    }
+"""
+
+# Accent buttons pick these up through their "variant" property, so the rules are parsed once
+# as part of the window stylesheet instead of in a separate stylesheet on every button
+BUTTON_VARIANT_STYLESHEET = """
+    QPushButton[variant="success"] { background-color: #6EBC9A; }
+    QPushButton[variant="success"]:hover { background-color: #5AA885; }
+    QPushButton[variant="success"]:pressed { background-color: #4A8A70; }
+    
+    QPushButton[variant="danger"] { background-color: #BC6E8A; }
+    QPushButton[variant="danger"]:hover { background-color: #A85A76; }
+    QPushButton[variant="danger"]:pressed { background-color: #8A4A62; }
+    
+    QPushButton[variant="help"] {
+        background-color: #6EA6BC;
+        border: 1px solid #ffffff;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 14px;
+        padding: 6px;
+    }
+"""
+
+# Theme-independent rules for widgets tagged with an object name or "role" property,
+# so switching themes is a single window setStyleSheet with no per-widget sheets to re-parse
+WIDGET_ROLE_STYLESHEET = """
+    QCheckBox#themeToggle {
+        font-size: 12px;
+        font-weight: 500;
+        margin: 8px 5px;
+        min-height: 20px;
+    }
+    
+    QWidget[role="formRow"], QWidget[role="formRow"] QWidget {
+        padding-top: 4px;
+        padding-bottom: 4px;
+    }
+    
+    QLabel[role="hint"] { font-size: 10px; color: #888888; }
+"""
+
+# Stylesheet for each value of MainWindow.is_dark_mode
+THEME_STYLESHEETS = {
+    True: DARK_STYLESHEET + BUTTON_VARIANT_STYLESHEET + WIDGET_ROLE_STYLESHEET,
+    False: LIGHT_STYLESHEET + BUTTON_VARIANT_STYLESHEET + WIDGET_ROLE_STYLESHEET
+}
+
+def get_icon_path():
+    """Return the path of the application icon"""
+    # Check if running as executable (PyInstaller)
+    if getattr(sys, 'frozen', False):
+        # Running as executable - icon is bundled in the same directory as exe
+        return os.path.join(sys._MEIPASS, 'v3icon.ico')
+    # Running as script - icon is in project root
+    return os.path.join(parent_dir, 'v3icon.ico')
+
+def create_application():
+    """Create (or return) the single QApplication shared by every entry point"""
+    app = QApplication.instance()
+    if app is not None:
+        return app
+    
+    # These attributes only take effect when set before the QApplication exists
+    QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QCoreApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+    
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')  # Use Fusion style for better dark theme support
+    
+    # Set application properties
+    app.setApplicationName("Commercial Real Estate Crawler")
+    app.setApplicationVersion("3.0")
+    app.setOrganizationName("Commercial Real Estate Tools")
+    
+    # Set application icon (for taskbar and window)
+    icon_path = get_icon_path()
+    if os.path.exists(icon_path):
+        app.setWindowIcon(QIcon(icon_path))
+    
+    return app
+
 class WorkerThread(QThread):
     """Worker thread for background tasks"""
     progress_updated = pyqtSignal(dict)
     
+    # Seconds between task status refreshes
+    POLL_INTERVAL = 3
+    
     def __init__(self, task_manager, parent=None):
         super().__init__(parent)
         self.running = True
         self.task_manager = task_manager
         self.parent = parent
+        self._stop_event = threading.Event()
+        
+        # Summary of latest_results.json, re-read only when the file changes
+        self._latest_results_mtime = None
+        self._latest_results_summary = None
     
     def run(self):
         """Run the worker thread"""
@@ -85,9 +740,17 @@ class WorkerThread(QThread):
                 try:
                     latest_results_file = os.path.join(CONFIG_DIR, "latest_results.json")
                     if os.path.exists(latest_results_file):
-                        with open(latest_results_file, 'r') as f:
-                            latest_data = json.load(f)
-                            status['latest_results'] = latest_data
+                        mtime = os.path.getmtime(latest_results_file)
+                        if mtime != self._latest_results_mtime:
+                            with open(latest_results_file, 'r') as f:
+                                latest_data = json.load(f)
+                            # The status display only needs the count and time, not the listings
+                            self._latest_results_summary = {
+                                'total_results': latest_data.get('total_results', 0),
+                                'datetime': latest_data.get('datetime', 'Unknown')
+                            }
+                            self._latest_results_mtime = mtime
+                        status['latest_results'] = self._latest_results_summary
                 except Exception as e:
                     logger.debug(f"Could not load latest results: {e}")
                 
@@ -97,12 +760,13 @@ class WorkerThread(QThread):
                 status = {"installed": False, "enabled": False, "error": str(e)}
                 self.progress_updated.emit(status)
             
-            # Sleep for a bit
-            time.sleep(3)
+            # Wait for the next refresh; stop() wakes this immediately instead of after a full sleep
+            self._stop_event.wait(self.POLL_INTERVAL)
     
     def stop(self):
         """Stop the worker thread"""
         self.running = False
+        self._stop_event.set()
         self.wait()
 
 class MainWindow(QMainWindow):
@@ -123,24 +787,32 @@ class MainWindow(QMainWindow):
         # Load configuration first
         self.load_config()
         
+        # Auto-saves are debounced so a burst of edits (e.g. typing) writes the file once
+        self._config_dir_created = False
+        self._last_written_hash = None
+        self._auto_save_timer = QTimer(self)
+        self._auto_save_timer.setSingleShot(True)
+        self._auto_save_timer.setInterval(AUTO_SAVE_DELAY_MS)
+        self._auto_save_timer.timeout.connect(self._flush_auto_save)
+        
+        # Listing content -> (display text, email text)
+        self._listing_text_cache = {}
+        
+        # SMTP sends run here so a finished scrape isn't held up waiting on the mail server
+        self._email_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email")
+        
         # Setup window
         self.setWindowTitle("Commercial Real Estate Crawler - Task Scheduler")
         self.setGeometry(100, 100, 1200, 800)
         
         # Set window icon (if icon file exists)
-        # Check if running as executable (PyInstaller)
-        if getattr(sys, 'frozen', False):
-            # Running as executable - icon is bundled in the same directory as exe
-            icon_path = os.path.join(sys._MEIPASS, 'v3icon.ico')
-        else:
-            # Running as script - icon is in project root
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'v3icon.ico')
-        
+        icon_path = get_icon_path()
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
         
         # Setup styles (start with user's preferred theme)
         self.is_dark_mode = self.user_config.get('dark_mode', True)
+        self._applied_theme = None
         self.apply_theme()
         
         # Create and set up the UI
@@ -178,9 +850,9 @@ class MainWindow(QMainWindow):
                 # Create config directory if it doesn't exist
                 os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
                 self.user_config = DEFAULT_CONFIG.copy()
-                with open(CONFIG_FILE, 'w') as f:
-                    json.dump(self.user_config, f, indent=2)
-        except Exception as e:
+                write_json_atomic(CONFIG_FILE, self.user_config, indent=2)
+        except (OSError, ValueError) as e:
+            # Unreadable or malformed config (json.JSONDecodeError is a ValueError)
             logger.error(f"Error loading config: {str(e)}")
             self.user_config = DEFAULT_CONFIG.copy()
     
@@ -190,14 +862,7 @@ class MainWindow(QMainWindow):
         self.dark_mode_toggle = QCheckBox("🌙 Dark Mode")
         self.dark_mode_toggle.setChecked(self.user_config.get('dark_mode', True))
         self.dark_mode_toggle.toggled.connect(self.toggle_theme)
-        self.dark_mode_toggle.setStyleSheet("""
-            QCheckBox {
-                font-size: 12px;
-                font-weight: 500;
-                margin: 8px 5px;
-                min-height: 20px;
-            }
-        """)
+        self.dark_mode_toggle.setObjectName("themeToggle")
         
         # Update text based on current mode
         if self.is_dark_mode:
@@ -205,572 +870,13 @@ class MainWindow(QMainWindow):
         else:
             self.dark_mode_toggle.setText("☀️ Light Mode")
     
-    def setup_dark_theme(self):
-        """Set up modern dark theme for the application"""
-        # Apply a modern dark stylesheet with proper contrast
-        self.setStyleSheet("""
-            /* Main Window */
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            /* Input Fields - Dark background with white text */
-            QLineEdit, QSpinBox, QTimeEdit, QComboBox {
-                background-color: #3c3c3c;
-                border: 2px solid #555555;
-                border-radius: 6px;
-                padding: 8px;
-                color: #ffffff;
-                font-size: 13px;
-                font-weight: normal;
-                selection-background-color: #6EA6BC;
-                min-height: 20px;
-                max-height: 36px;
-            }
-            
-            QLineEdit:focus, QSpinBox:focus, QTimeEdit:focus, QComboBox:focus {
-                border-color: #6EA6BC;
-                background-color: #404040;
-                outline: none;
-            }
-            
-            QLineEdit:hover, QSpinBox:hover, QTimeEdit:hover, QComboBox:hover {
-                border-color: #6EA6BC;
-            }
-            
-            QLineEdit::placeholder {
-                color: #888888;
-                font-style: italic;
-            }
-            
-            /* Completely hide SpinBox and TimeEdit buttons */
-            QSpinBox::up-button, QSpinBox::down-button, 
-            QTimeEdit::up-button, QTimeEdit::down-button {
-                width: 0px;
-                height: 0px;
-                border: none;
-                background: transparent;
-                subcontrol-origin: border;
-                subcontrol-position: right;
-            }
-            
-            QSpinBox::up-arrow, QSpinBox::down-arrow, 
-            QTimeEdit::up-arrow, QTimeEdit::down-arrow {
-                width: 0px;
-                height: 0px;
-                border: none;
-                background: transparent;
-            }
-            
-            /* ComboBox dropdown styling */
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-                background: transparent;
-            }
-            
-            QComboBox::down-arrow {
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTMgNC41TDYgNy41TDkgNC41IiBzdHJva2U9IiNmZmZmZmYiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-                width: 12px;
-                height: 12px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #3c3c3c;
-                border: 2px solid #555555;
-                border-radius: 6px;
-                color: #ffffff;
-                selection-background-color: #6EA6BC;
-                outline: none;
-            }
-            
-            /* Buttons */
-            QPushButton {
-                background-color: #6EA6BC;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 16px;
-                color: white;
-                font-weight: 500;
-                font-size: 11px;
-                min-height: 20px;
-            }
-            
-            QPushButton:hover {
-                background-color: #5A94A8;
-            }
-            
-            QPushButton:pressed {
-                background-color: #4A7A8A;
-            }
-            
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #888888;
-            }
-            
-            /* Checkboxes */
-            QCheckBox {
-                color: #ffffff;
-                font-size: 11px;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 2px solid #555555;
-                background-color: #3c3c3c;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #6EA6BC;
-                border-color: #ffffff;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-            }
-            
-            QCheckBox::indicator:hover {
-                border-color: #6EA6BC;
-            }
-            
-            /* Group Boxes */
-            QGroupBox {
-                font-weight: 600;
-                font-size: 12px;
-                color: #ffffff;
-                border: 2px solid #555555;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding: 16px;  /* Increased padding */
-                background-color: #323232;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px 0 8px;
-                color: #ffffff;
-                background-color: #323232;
-            }
-            
-            /* Tabs */
-            QTabWidget::pane {
-                border: 2px solid #555555;
-                border-radius: 6px;
-                background-color: #2b2b2b;
-                margin-top: -1px;
-            }
-            
-            QTabBar::tab {
-                background-color: #3c3c3c;
-                border: 2px solid #555555;
-                border-bottom: none;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                padding: 10px 32px;  /* Reverted padding */
-                margin-right: 2px;
-                color: #ffffff;
-                font-weight: 500;
-                min-width: 120px;  /* Increased min-width to prevent text cutoff */
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #2b2b2b;
-                border-color: #555555;
-                border-bottom: 2px solid #2b2b2b;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background-color: #484848;
-            }
-            
-            /* Labels */
-            QLabel {
-                color: #ffffff;
-                font-size: 11px;
-            }
-            
-            /* Text Areas */
-            QTextEdit {
-                background-color: #3c3c3c;
-                border: 2px solid #555555;
-                border-radius: 6px;
-                color: #ffffff;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 10px;
-                selection-background-color: #6EA6BC;
-            }
-            
-            /* Scrollbars */
-            QScrollBar:vertical {
-                background-color: #3c3c3c;
-                width: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #555555;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #666666;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-            
-
-            
-            /* Message Boxes and Dialogs */
-            QMessageBox {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QMessageBox QLabel {
-                color: #ffffff;
-                background-color: transparent;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #6EA6BC;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: 500;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #5A94A8;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #4A7A8A;
-            }
-            
-            /* File Dialog */
-            QFileDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QFileDialog QLabel {
-                color: #ffffff;
-            }
-            
-            QFileDialog QLineEdit {
-                background-color: #3c3c3c;
-                border: 2px solid #555555;
-                border-radius: 6px;
-                padding: 8px;
-                color: #ffffff;
-            }
-            
-            /* Scroll Areas */
-            QScrollArea {
-                background-color: #2b2b2b;
-                border: none;
-            }
-            
-            QScrollArea > QWidget > QWidget {
-                background-color: #2b2b2b;
-            }
-        """)
-    
-    def setup_light_theme(self):
-        """Set up modern light theme for the application"""
-        # Apply a modern light stylesheet
-        self.setStyleSheet("""
-            /* Main Window */
-            QMainWindow {
-                background-color: #f5f5f5;
-                color: #333333;
-            }
-            
-            /* Input Fields */
-            QLineEdit, QSpinBox, QTimeEdit, QComboBox {
-                background-color: #ffffff;
-                border: 2px solid #cccccc;
-                border-radius: 6px;
-                padding: 8px;
-                color: #333333;
-                font-size: 13px;
-                font-weight: normal;
-                selection-background-color: #6EA6BC;
-                min-height: 20px;
-                max-height: 36px;
-            }
-            
-            QLineEdit:focus, QSpinBox:focus, QTimeEdit:focus, QComboBox:focus {
-                border-color: #6EA6BC;
-                background-color: #ffffff;
-                outline: none;
-            }
-            
-            QLineEdit:hover, QSpinBox:hover, QTimeEdit:hover, QComboBox:hover {
-                border-color: #6EA6BC;
-            }
-            
-            QLineEdit::placeholder {
-                color: #888888;
-                font-style: italic;
-            }
-            
-            /* Completely hide SpinBox and TimeEdit buttons */
-            QSpinBox::up-button, QSpinBox::down-button, 
-            QTimeEdit::up-button, QTimeEdit::down-button {
-                width: 0px;
-                height: 0px;
-                border: none;
-                background: transparent;
-                subcontrol-origin: border;
-                subcontrol-position: right;
-            }
-            
-            QSpinBox::up-arrow, QSpinBox::down-arrow, 
-            QTimeEdit::up-arrow, QTimeEdit::down-arrow {
-                width: 0px;
-                height: 0px;
-                border: none;
-                background: transparent;
-            }
-            
-            /* ComboBox dropdown styling */
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-                background: transparent;
-            }
-            
-            QComboBox::down-arrow {
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTMgNC41TDYgNy41TDkgNC41IiBzdHJva2U9IiMzMzMzMzMiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-                width: 12px;
-                height: 12px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                border: 2px solid #cccccc;
-                border-radius: 6px;
-                color: #333333;
-                selection-background-color: #6EA6BC;
-                outline: none;
-            }
-            
-            /* Buttons */
-            QPushButton {
-                background-color: #6EA6BC;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 16px;
-                color: white;
-                font-weight: 500;
-                font-size: 11px;
-                min-height: 20px;
-            }
-            
-            QPushButton:hover {
-                background-color: #5A94A8;
-            }
-            
-            QPushButton:pressed {
-                background-color: #4A7A8A;
-            }
-            
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #888888;
-            }
-            
-            /* Checkboxes */
-            QCheckBox {
-                color: #333333;
-                font-size: 11px;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 2px solid #cccccc;
-                background-color: #ffffff;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #6EA6BC;
-                border-color: #333333;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-            }
-            
-            QCheckBox::indicator:hover {
-                border-color: #6EA6BC;
-            }
-            
-            /* Group Boxes */
-            QGroupBox {
-                font-weight: 600;
-                font-size: 12px;
-                color: #333333;
-                border: 2px solid #cccccc;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding: 16px;  /* Increased padding */
-                background-color: #ffffff;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px 0 8px;
-                color: #333333;
-                background-color: #ffffff;
-            }
-            
-            /* Tabs */
-            QTabWidget::pane {
-                border: 2px solid #cccccc;
-                border-radius: 6px;
-                background-color: #f5f5f5;
-                margin-top: -1px;
-            }
-            
-            QTabBar::tab {
-                background-color: #ffffff;
-                border: 2px solid #cccccc;
-                border-bottom: none;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                padding: 10px 32px;  /* Reverted padding */
-                margin-right: 2px;
-                color: #333333;
-                font-weight: 500;
-                min-width: 120px;  /* Increased min-width to prevent text cutoff */
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #f5f5f5;
-                border-color: #cccccc;
-                border-bottom: 2px solid #f5f5f5;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background-color: #e8e8e8;
-            }
-            
-            /* Labels */
-            QLabel {
-                color: #333333;
-                font-size: 11px;
-            }
-            
-            /* Text Areas */
-            QTextEdit {
-                background-color: #ffffff;
-                border: 2px solid #cccccc;
-                border-radius: 6px;
-                color: #333333;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 10px;
-                selection-background-color: #6EA6BC;
-            }
-            
-            /* Scrollbars */
-            QScrollBar:vertical {
-                background-color: #ffffff;
-                width: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #cccccc;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #999999;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-            
-
-            
-            /* Message Boxes and Dialogs */
-            QMessageBox {
-                background-color: #f5f5f5;
-                color: #333333;
-            }
-            
-            QMessageBox QLabel {
-                color: #333333;
-                background-color: transparent;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #6EA6BC;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: 500;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #5A94A8;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #4A7A8A;
-            }
-            
-            /* File Dialog */
-            QFileDialog {
-                background-color: #f5f5f5;
-                color: #333333;
-            }
-            
-            QFileDialog QLabel {
-                color: #333333;
-            }
-            
-            QFileDialog QLineEdit {
-                background-color: #ffffff;
-                border: 2px solid #cccccc;
-                border-radius: 6px;
-                padding: 8px;
-                color: #333333;
-            }
-            
-            /* Scroll Areas */
-            QScrollArea {
-                background-color: #f5f5f5;
-                border: none;
-            }
-            
-            QScrollArea > QWidget > QWidget {
-                background-color: #f5f5f5;
-            }
-        """)
-    
     def apply_theme(self):
         """Apply the current theme (dark or light)"""
-        if self.is_dark_mode:
-            self.setup_dark_theme()
-        else:
-            self.setup_light_theme()
+        # Setting a window stylesheet re-polishes every child widget, so only do it on a change
+        if self._applied_theme == self.is_dark_mode:
+            return
+        self.setStyleSheet(THEME_STYLESHEETS[self.is_dark_mode])
+        self._applied_theme = self.is_dark_mode
     
     def toggle_theme(self):
         """Toggle between dark and light themes"""
@@ -826,7 +932,7 @@ class MainWindow(QMainWindow):
         # Run Now button (green) - Auto-installs if needed
         self.run_now_btn = QPushButton("⚡ Run Now")
         self.run_now_btn.setMinimumHeight(50)
-        self.run_now_btn.setStyleSheet("QPushButton { background-color: #6EBC9A; } QPushButton:hover { background-color: #5AA885; } QPushButton:pressed { background-color: #4A8A70; }")
+        self.run_now_btn.setProperty("variant", "success")
         self.run_now_btn.clicked.connect(self.run_now)
         button_layout.addWidget(self.run_now_btn)
         
@@ -863,6 +969,14 @@ class MainWindow(QMainWindow):
         types_layout.addWidget(self.retail_cb)
         types_layout.addWidget(self.industrial_cb)
         types_layout.addWidget(self.multifamily_cb)
+        
+        # Config value for each property type checkbox
+        self.property_type_checkboxes = (
+            ('Office', self.office_cb),
+            ('Retail', self.retail_cb),
+            ('Industrial', self.industrial_cb),
+            ('Multifamily', self.multifamily_cb)
+        )
         types_layout.addStretch()
         
         search_layout.addRow("Property Types:", self.property_types)
@@ -876,14 +990,17 @@ class MainWindow(QMainWindow):
         price_widget = QWidget()
         price_layout = QHBoxLayout(price_widget)
         price_layout.setContentsMargins(0, 0, 0, 0)
-        price_widget.setStyleSheet("padding-top: 4px; padding-bottom: 4px;")
+        price_widget.setProperty("role", "formRow")
         price_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.MinimumExpanding)
         price_layout.setAlignment(Qt.AlignVCenter)
         
+        # Only whole-dollar amounts can be typed into the price fields
         self.min_price_edit = QLineEdit()
         self.min_price_edit.setPlaceholderText("Min price")
+        self.min_price_edit.setValidator(QIntValidator(0, 2147483647, self.min_price_edit))
         self.max_price_edit = QLineEdit()
         self.max_price_edit.setPlaceholderText("Max price")
+        self.max_price_edit.setValidator(QIntValidator(0, 2147483647, self.max_price_edit))
         
         price_layout.addWidget(QLabel("Min:"))
         price_layout.addWidget(self.min_price_edit)
@@ -897,7 +1014,7 @@ class MainWindow(QMainWindow):
         websites_widget = QWidget()
         websites_layout = QHBoxLayout(websites_widget)
         websites_layout.setContentsMargins(0, 0, 0, 0)
-        websites_widget.setStyleSheet("padding-top: 4px; padding-bottom: 4px;")
+        websites_widget.setProperty("role", "formRow")
         websites_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.MinimumExpanding)
         
         self.realcommercial_cb = QCheckBox("LoopNet.com")
@@ -905,6 +1022,12 @@ class MainWindow(QMainWindow):
         
         websites_layout.addWidget(self.realcommercial_cb)
         websites_layout.addWidget(self.commercialrealestate_cb)
+        
+        # Config value for each website checkbox
+        self.website_checkboxes = (
+            ('loopnet.com', self.realcommercial_cb),
+            ('commercialmls.com', self.commercialrealestate_cb)
+        )
         websites_layout.addStretch()
         
         search_layout.addRow("Websites:", websites_widget)
@@ -914,6 +1037,7 @@ class MainWindow(QMainWindow):
         self.days_back_spin.setMinimum(1)
         self.days_back_spin.setMaximum(30)
         self.days_back_spin.setValue(1)
+        self.scope_wheel_to_focus(self.days_back_spin)
         search_layout.addRow("Days Back:", self.days_back_spin)
         
         layout.addWidget(search_group)
@@ -936,7 +1060,7 @@ class MainWindow(QMainWindow):
         times_header.addWidget(QLabel("Scheduled Times:"))
         self.add_time_btn = QPushButton("Add Time")
         self.add_time_btn.setMaximumWidth(100)
-        self.add_time_btn.setStyleSheet("QPushButton { background-color: #6EBC9A; } QPushButton:hover { background-color: #5AA885; } QPushButton:pressed { background-color: #4A8A70; }")
+        self.add_time_btn.setProperty("variant", "success")
         self.add_time_btn.clicked.connect(self.add_scheduled_time)
         times_header.addWidget(self.add_time_btn)
         times_header.addStretch()
@@ -976,7 +1100,7 @@ class MainWindow(QMainWindow):
         # Help button for app password explanation
         self.help_btn = QPushButton("?")
         self.help_btn.setFixedWidth(32)
-        self.help_btn.setStyleSheet("QPushButton { background-color: #6EA6BC; border: 1px solid #ffffff; border-radius: 6px; font-weight: bold; font-size: 14px; padding: 6px; }")
+        self.help_btn.setProperty("variant", "help")
         self.help_btn.clicked.connect(self.show_app_password_help)
         
         password_layout.addWidget(self.email_password_edit)
@@ -1006,7 +1130,7 @@ class MainWindow(QMainWindow):
         
         # Full uninstall
         self.full_uninstall_btn = QPushButton("🗑️ Complete Uninstall")
-        self.full_uninstall_btn.setStyleSheet("QPushButton { background-color: #BC6E8A; } QPushButton:hover { background-color: #A85A76; } QPushButton:pressed { background-color: #8A4A62; }")
+        self.full_uninstall_btn.setProperty("variant", "danger")
         self.full_uninstall_btn.clicked.connect(self.full_uninstall)
         uninstall_buttons_layout.addWidget(self.full_uninstall_btn)
         
@@ -1014,7 +1138,7 @@ class MainWindow(QMainWindow):
         
         # Info label
         info_label = QLabel("Complete Uninstall removes: scheduled task, all settings, email credentials, and saved results.")
-        info_label.setStyleSheet("QLabel { font-size: 10px; color: #888888; }")
+        info_label.setProperty("role", "hint")
         info_label.setWordWrap(True)
         uninstall_layout.addRow("", info_label)
         
@@ -1069,7 +1193,8 @@ class MainWindow(QMainWindow):
         layout.addWidget(refresh_btn)
         
         # Results display
-        self.results_text = QTextEdit()
+        # Plain-text widget: no rich-text document layout, and its block-based layout is lazy for large dumps
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
         layout.addWidget(self.results_text)
         
@@ -1086,7 +1211,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(refresh_log_btn)
         
         # Logs display
-        self.logs_text = QTextEdit()
+        self.logs_text = QPlainTextEdit()
         self.logs_text.setReadOnly(True)
         layout.addWidget(self.logs_text)
         
@@ -1110,7 +1235,7 @@ class MainWindow(QMainWindow):
                     parameters += " --debug"
             else:
                 # Running as script - always use the launcher
-                launcher_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'launch_gui.py')
+                launcher_path = os.path.join(parent_dir, 'launch_gui.py')
                 exe_path = sys.executable
                 if os.path.exists(launcher_path):
                     parameters = f'"{launcher_path}" --auto-save'
@@ -1152,33 +1277,39 @@ class MainWindow(QMainWindow):
     def load_values(self):
         """Load configuration values into UI elements"""
         try:
+            config = self.user_config
+            
             # Property types
-            property_types = self.user_config.get('property_types', [])
-            self.office_cb.setChecked('Office' in property_types)
-            self.retail_cb.setChecked('Retail' in property_types)
-            self.industrial_cb.setChecked('Industrial' in property_types)
-            self.multifamily_cb.setChecked('Multifamily' in property_types)
+            property_types = set(config.get('property_types', []))
+            for name, checkbox in self.property_type_checkboxes:
+                checkbox.setChecked(name in property_types)
             
             # Location
-            self.location_edit.setText(self.user_config.get('location', ''))
+            self.location_edit.setText(config.get('location', ''))
             
-            # Price range
-            self.min_price_edit.setText(str(self.user_config.get('min_price', '')))
-            self.max_price_edit.setText(str(self.user_config.get('max_price', '')))
+            # Price range, normalized to the whole dollars the price validators accept
+            # (older configurations may hold "$1,500,000")
+            for edit, key in ((self.min_price_edit, 'min_price'), (self.max_price_edit, 'max_price')):
+                try:
+                    price = parse_price(config.get(key))
+                except ValueError as e:
+                    logger.warning(f"Ignoring saved {key}: {str(e)}")
+                    price = None
+                edit.setText('' if price is None else str(price))
             
             # Websites
-            websites = self.user_config.get('websites', [])
-            self.realcommercial_cb.setChecked('loopnet.com' in websites)
-            self.commercialrealestate_cb.setChecked('commercialmls.com' in websites)
+            websites = set(config.get('websites', []))
+            for name, checkbox in self.website_checkboxes:
+                checkbox.setChecked(name in websites)
             
             # Days back
-            self.days_back_spin.setValue(self.user_config.get('days_back', 1))
+            self.days_back_spin.setValue(config.get('days_back', 1))
             
             # Background enabled
-            self.background_enabled_cb.setChecked(self.user_config.get('enable_background', False))
+            self.background_enabled_cb.setChecked(config.get('enable_background', False))
             
             # Scheduled times
-            scheduled_times = self.user_config.get('scheduled_times', ['11:00'])
+            scheduled_times = config.get('scheduled_times', ['11:00'])
             for time_str in scheduled_times:
                 self.add_scheduled_time(time_str)
             
@@ -1186,7 +1317,7 @@ class MainWindow(QMainWindow):
             email, password = self.get_email_credentials()
             self.email_edit.setText(email)
             self.email_password_edit.setText(password)
-            self.send_email_cb.setChecked(self.user_config.get('send_email', False))
+            self.send_email_cb.setChecked(config.get('send_email', False))
             
             # Update credentials checkbox state without triggering the toggle event
             has_credentials = bool(email and password)
@@ -1213,13 +1344,14 @@ class MainWindow(QMainWindow):
                 time_edit.setTime(QTime(11, 0))  # Default time (11:00 AM)
         else:
             time_edit.setTime(QTime(11, 0))  # Default time (11:00 AM)
+        self.scope_wheel_to_focus(time_edit)
         
         # Connect auto-save to new time field
         time_edit.timeChanged.connect(self.auto_save_config)
         
         remove_btn = QPushButton("Remove")
         remove_btn.setMaximumWidth(90)
-        remove_btn.setStyleSheet("QPushButton { background-color: #BC6E8A; } QPushButton:hover { background-color: #A85A76; } QPushButton:pressed { background-color: #8A4A62; }")
+        remove_btn.setProperty("variant", "danger")
         remove_btn.clicked.connect(lambda: self.remove_scheduled_time(time_widget))
         
         time_layout.addWidget(time_edit)
@@ -1228,6 +1360,19 @@ class MainWindow(QMainWindow):
         
         self.times_container_layout.addWidget(time_widget)
 
+    def scope_wheel_to_focus(self, spin_box):
+        """Only let a spin box take wheel events once it has focus"""
+        spin_box.setFocusPolicy(Qt.StrongFocus)
+        spin_box.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Pass wheel events over unfocused spin boxes on to the scroll area"""
+        # Otherwise scrolling the config page over a spin box changes its value and triggers an auto-save
+        if event.type() == QEvent.Wheel and isinstance(obj, QAbstractSpinBox) and not obj.hasFocus():
+            event.ignore()
+            return True
+        return super().eventFilter(obj, event)
+
     def remove_scheduled_time(self, time_widget):
         """Remove a scheduled time entry"""
         self.times_container_layout.removeWidget(time_widget)
@@ -1257,10 +1402,8 @@ class MainWindow(QMainWindow):
         self._auto_save_setup = True
         
         # Property type checkboxes
-        self.office_cb.toggled.connect(self.auto_save_config)
-        self.retail_cb.toggled.connect(self.auto_save_config)
-        self.industrial_cb.toggled.connect(self.auto_save_config)
-        self.multifamily_cb.toggled.connect(self.auto_save_config)
+        for _, checkbox in self.property_type_checkboxes:
+            checkbox.toggled.connect(self.auto_save_config)
         
         # Text fields
         self.location_edit.textChanged.connect(self.auto_save_config)
@@ -1268,8 +1411,8 @@ class MainWindow(QMainWindow):
         self.max_price_edit.textChanged.connect(self.auto_save_config)
         
         # Website checkboxes
-        self.realcommercial_cb.toggled.connect(self.auto_save_config)
-        self.commercialrealestate_cb.toggled.connect(self.auto_save_config)
+        for _, checkbox in self.website_checkboxes:
+            checkbox.toggled.connect(self.auto_save_config)
         
         # Spinbox and background settings
         self.days_back_spin.valueChanged.connect(self.auto_save_config)
@@ -1281,7 +1424,11 @@ class MainWindow(QMainWindow):
         logger.info("Auto-save enabled for all configuration fields")
 
     def auto_save_config(self):
-        """Auto-save configuration whenever any field changes"""
+        """Schedule an auto-save; restarting the timer coalesces rapid changes"""
+        self._auto_save_timer.start()
+    
+    def _flush_auto_save(self):
+        """Write the configuration once the edits have settled"""
         try:
             self.save_configuration()
             logger.debug("Configuration auto-saved")
@@ -1290,12 +1437,19 @@ class MainWindow(QMainWindow):
     
     def setup_status_checker(self):
         """Set up background status checking"""
+        self._last_status_display = None
         self.worker_thread = WorkerThread(self.task_manager, self)
         self.worker_thread.progress_updated.connect(self.update_status_display)
         self.worker_thread.start()
     
     def update_status_display(self, status):
         """Update the status display with current information"""
+        # The worker reports every few seconds; skip relabelling (and relayout) when nothing changed
+        display_key = (status, self.scraping_running)
+        if display_key == self._last_status_display:
+            return
+        self._last_status_display = display_key
+        
         try:
             # Update status labels
             self.status_installed_label.setText("Yes" if status.get('installed', False) else "No")
@@ -1350,26 +1504,20 @@ class MainWindow(QMainWindow):
     def run_scraper_directly(self):
         """Run the scraper directly for immediate execution"""
         try:
+            from scraper.scraper_manager import ScraperManager
+            
             # Get search parameters
-            property_types = []
-            if self.office_cb.isChecked():
-                property_types.append('office')
-            if self.retail_cb.isChecked():
-                property_types.append('retail')
-            if self.industrial_cb.isChecked():
-                property_types.append('industrial')
-            if self.multifamily_cb.isChecked():
-                property_types.append('multifamily')
+            property_types = [name.lower() for name, checkbox in self.property_type_checkboxes if checkbox.isChecked()]
             
             location = self.location_edit.text().strip()
-            min_price = self.min_price_edit.text().strip() or None
-            max_price = self.max_price_edit.text().strip() or None
+            try:
+                min_price = parse_price(self.min_price_edit.text())
+                max_price = parse_price(self.max_price_edit.text())
+            except ValueError as e:
+                QMessageBox.warning(self, "Error", f"Please enter the price range as whole dollars. {str(e)}")
+                return
             
-            websites = []
-            if self.realcommercial_cb.isChecked():
-                websites.append('loopnet.com')
-            if self.commercialrealestate_cb.isChecked():
-                websites.append('commercialmls.com')
+            websites = [name for name, checkbox in self.website_checkboxes if checkbox.isChecked()]
             
             days_back = self.days_back_spin.value()
             
@@ -1404,15 +1552,9 @@ class MainWindow(QMainWindow):
                     )
                     
                     # Save latest results (overwrite previous)
-                    total_results = 0
-                    if isinstance(results, dict):
-                        for website, website_results in results.items():
-                            count = len(website_results) if website_results else 0
-                            total_results += count
-                            logger.info(f"Found {count} results on {website}")
-                    else:
-                        total_results = len(results) if results else 0
-                        logger.info(f"Found {total_results} total results")
+                    # Per-site counts are logged by ScraperManager
+                    total_results = total_count(results)
+                    logger.info(f"Found {total_results} total results")
                     
                     # Save to single latest results file (overwrite each time)
                     os.makedirs(CONFIG_DIR, exist_ok=True)
@@ -1423,13 +1565,13 @@ class MainWindow(QMainWindow):
                         "datetime": datetime.now().isoformat(),
                         "trigger": "manual_run"
                     }
-                    with open(latest_results_file, 'w') as f:
-                        json.dump(results_data, f, indent=2, default=str)
+                    # Atomic so the status worker never reads a half-written file; compact since it can be large
+                    write_json_atomic(latest_results_file, results_data, separators=(',', ':'), default=str)
                     
                     logger.info(f"=== Manual scraping completed successfully! Total results: {total_results} ===")
                     
-                    # Send email if enabled and configured
-                    self.send_scraping_email(results, results_data)
+                    # Send email if enabled and configured (in the background)
+                    self._email_pool.submit(self.send_scraping_email, results, results_data)
         
                 except Exception as e:
                     logger.error(f"Error during manual scraping: {str(e)}")
@@ -1569,23 +1711,14 @@ class MainWindow(QMainWindow):
     def save_configuration(self):
         """Save the current configuration"""
         try:
+            # Any pending auto-save is covered by this write
+            self._auto_save_timer.stop()
+            
             # Collect property types
-            property_types = []
-            if self.office_cb.isChecked():
-                property_types.append('Office')
-            if self.retail_cb.isChecked():
-                property_types.append('Retail')
-            if self.industrial_cb.isChecked():
-                property_types.append('Industrial')
-            if self.multifamily_cb.isChecked():
-                property_types.append('Multifamily')
+            property_types = [name for name, checkbox in self.property_type_checkboxes if checkbox.isChecked()]
             
             # Collect websites
-            websites = []
-            if self.realcommercial_cb.isChecked():
-                websites.append('loopnet.com')
-            if self.commercialrealestate_cb.isChecked():
-                websites.append('commercialmls.com')
+            websites = [name for name, checkbox in self.website_checkboxes if checkbox.isChecked()]
             
             # Update configuration (email credentials saved separately via button)
             self.user_config.update({
@@ -1600,10 +1733,19 @@ class MainWindow(QMainWindow):
                 'send_email': self.send_email_cb.isChecked()
             })
             
+            # Skip the write when the serialized config matches what was last written
+            config_text = json.dumps(self.user_config, indent=2)
+            config_hash = hashlib.blake2b(config_text.encode('utf-8'), digest_size=16).digest()
+            if config_hash == self._last_written_hash:
+                logger.debug("Configuration unchanged, skipping write")
+                return
+            
             # Save to file
-            os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.user_config, f, indent=2)
+            if not self._config_dir_created:
+                os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
+                self._config_dir_created = True
+            write_text_atomic(CONFIG_FILE, config_text)
+            self._last_written_hash = config_hash
             
             logger.info(f"Configuration saved successfully to {CONFIG_FILE}")
             logger.info(f"Saved config: {self.user_config}")
@@ -1689,8 +1831,7 @@ class MainWindow(QMainWindow):
                 'password': password
             }
             
-            with open(email_credentials_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_json_atomic(email_credentials_file, data, indent=2)
             
             logger.info(f"Email credentials saved successfully to {email_credentials_file}")
             return True
@@ -1760,88 +1901,87 @@ class MainWindow(QMainWindow):
 
     def format_listing_details(self, listing):
         """Format a single listing's details for display"""
-        details = []
+        # Look each field up once instead of an `in` test followed by an index
+        get = listing.get
+        address = get('address')
         
         # Title/Address
-        if 'title' in listing and listing['title']:
-            details.append(listing['title'])
-        elif 'address' in listing and listing['address']:
-            details.append(listing['address'])
-        else:
-            details.append("Property Details")
+        details = [get('title') or address or "Property Details"]
         
         # Price
-        if 'price' in listing and listing['price']:
-            details.append(f"💰 Price: {listing['price']}")
+        price = get('price')
+        if price:
+            details.append(f"💰 Price: {price}")
         
         # Property Type
-        if 'property_type' in listing and listing['property_type']:
-            details.append(f"🏢 Type: {listing['property_type']}")
+        property_type = get('property_type')
+        if property_type:
+            details.append(f"🏢 Type: {property_type}")
         
         # Size/Area
-        if 'size' in listing and listing['size']:
-            details.append(f"📐 Size: {listing['size']}")
-        elif 'area' in listing and listing['area']:
-            details.append(f"📐 Area: {listing['area']}")
+        size = get('size')
+        area = get('area')
+        if size:
+            details.append(f"📐 Size: {size}")
+        elif area:
+            details.append(f"📐 Area: {area}")
         
         # Location
-        if 'location' in listing and listing['location']:
-            details.append(f"📍 Location: {listing['location']}")
-        elif 'address' in listing and listing['address'] and 'title' in listing:
-            details.append(f"📍 Address: {listing['address']}")
+        location = get('location')
+        if location:
+            details.append(f"📍 Location: {location}")
+        elif address and 'title' in listing:
+            details.append(f"📍 Address: {address}")
         
         # Description
-        if 'description' in listing and listing['description']:
-            desc = listing['description'][:200] + "..." if len(listing['description']) > 200 else listing['description']
+        description = get('description')
+        if description:
+            desc = description[:200] + "..." if len(description) > 200 else description
             details.append(f"📝 Description: {desc}")
         
         # URL
-        if 'url' in listing and listing['url']:
-            details.append(f"🔗 URL: {listing['url']}")
+        url = get('url')
+        if url:
+            details.append(f"🔗 URL: {url}")
         
         # Date
-        if 'date' in listing and listing['date']:
-            details.append(f"📅 Listed: {listing['date']}")
+        date = get('date')
+        if date:
+            details.append(f"📅 Listed: {date}")
         
         return details
 
+    def format_listing_text(self, listing, for_email=False):
+        """Return a listing's formatted block, reusing earlier formatting of the same listing"""
+        try:
+            key = tuple(listing.items())
+            cached = self._listing_text_cache.get(key)
+        except TypeError:
+            # Unhashable field values; format without caching
+            key, cached = None, None
+        
+        if cached is None:
+            display_text = "\n".join(self.format_listing_details(listing))
+            cached = (display_text, EMOJI_PREFIX_PATTERN.sub("", display_text))
+            if key is not None:
+                if len(self._listing_text_cache) >= LISTING_TEXT_CACHE_SIZE:
+                    self._listing_text_cache.clear()
+                self._listing_text_cache[key] = cached
+        
+        return cached[1] if for_email else cached[0]
+
+    def format_results_body(self, results, total_results, for_email=False):
+        """Format the per-website listing sections shared by the results tab and the email"""
+        return format_results_body(results, total_results,
+                                   lambda listing: self.format_listing_text(listing, for_email))
+
     def format_results_text(self, results, total_results, run_time, trigger):
         """Format results data into display text"""
-        results_text = f"=== Latest Results ({trigger} run at {run_time}) ===\n"
-        results_text += f"Total Properties Found: {total_results}\n\n"
-        
-        if total_results > 0:
-            # Handle both dict format {website: [listings]} and list format [listings]
-            if isinstance(results, dict):
-                # Multiple websites format
-                for website, website_results in results.items():
-                    if website_results and len(website_results) > 0:
-                        results_text += f"{'='*50}\n"
-                        results_text += f"{website.upper()} - {len(website_results)} Properties\n"
-                        results_text += f"{'='*50}\n\n"
-                        
-                        for i, listing in enumerate(website_results, 1):
-                            results_text += f"[{i}] "
-                            listing_details = self.format_listing_details(listing)
-                            results_text += "\n".join(listing_details)
-                            results_text += "\n\n" + "-"*40 + "\n\n"
-            elif isinstance(results, list):
-                # Single website or combined results format
-                results_text += f"{'='*50}\n"
-                results_text += f"SEARCH RESULTS - {len(results)} Properties\n"
-                results_text += f"{'='*50}\n\n"
-                
-                for i, listing in enumerate(results, 1):
-                    results_text += f"[{i}] "
-                    listing_details = self.format_listing_details(listing)
-                    results_text += "\n".join(listing_details)
-                    results_text += "\n\n" + "-"*40 + "\n\n"
-            else:
-                results_text += f"Found {total_results} results but data format not recognized.\n"
-        else:
-            results_text += "No new properties found matching your criteria.\n"
-        
-        return results_text
+        return "".join((
+            f"=== Latest Results ({trigger} run at {run_time}) ===\n",
+            f"Total Properties Found: {total_results}\n\n",
+            self.format_results_body(results, total_results)
+        ))
 
     def send_scraping_email(self, results, results_data):
         """Send email with scraping results if email is enabled and configured"""
@@ -1864,56 +2004,11 @@ class MainWindow(QMainWindow):
             subject = f"Commercial Real Estate Search Results - {total_results} Properties Found"
             
             # Create detailed email body (without emojis for better email compatibility)
-            email_body = f"""Commercial Real Estate Search Results
-=====================================
-
-Search completed: {run_time}
-Total properties found: {total_results}
-
-"""
-            
-            if total_results > 0:
-                # Handle both dict format {website: [listings]} and list format [listings]
-                if isinstance(results, dict):
-                    # Multiple websites format
-                    for website, website_results in results.items():
-                        if website_results and len(website_results) > 0:
-                            email_body += f"{'='*50}\n"
-                            email_body += f"{website.upper()} - {len(website_results)} Properties\n"
-                            email_body += f"{'='*50}\n\n"
-                            
-                            for i, listing in enumerate(website_results, 1):
-                                email_body += f"[{i}] "
-                                listing_details = self.format_listing_details(listing)
-                                # Remove emojis for email
-                                email_details = [detail.replace('💰 ', '').replace('🏢 ', '').replace('📐 ', '').replace('📍 ', '').replace('📝 ', '').replace('🔗 ', '').replace('📅 ', '') for detail in listing_details]
-                                email_body += "\n".join(email_details)
-                                email_body += "\n\n" + "-"*40 + "\n\n"
-                elif isinstance(results, list):
-                    # Single website or combined results format
-                    email_body += f"{'='*50}\n"
-                    email_body += f"SEARCH RESULTS - {len(results)} Properties\n"
-                    email_body += f"{'='*50}\n\n"
-                    
-                    for i, listing in enumerate(results, 1):
-                        email_body += f"[{i}] "
-                        listing_details = self.format_listing_details(listing)
-                        # Remove emojis for email
-                        email_details = [detail.replace('💰 ', '').replace('🏢 ', '').replace('📐 ', '').replace('📍 ', '').replace('📝 ', '').replace('🔗 ', '').replace('📅 ', '') for detail in listing_details]
-                        email_body += "\n".join(email_details)
-                        email_body += "\n\n" + "-"*40 + "\n\n"
-                else:
-                    email_body += f"Found {total_results} results but data format not recognized.\n"
-            else:
-                email_body += "No new properties found matching your criteria.\n"
-            
-            email_body += """
----
-This email was automatically sent by the Commercial Real Estate Crawler.
-To stop receiving these emails, uncheck 'Send email notifications' in the application.
-            """
+            email_body = format_email_body(results, total_results, run_time,
+                                           lambda listing: self.format_listing_text(listing, True))
             
             # Send email
+            from utils.email_sender import EmailSender
             email_sender = EmailSender()
             success = email_sender.send_email(email, subject, email_body, email, password)
             
@@ -1934,7 +2029,7 @@ To stop receiving these emails, uncheck 'Send email notifications' in the applic
             log_files = []
             
             # Check debug directory
-            debug_dir = os.path.join(os.path.dirname(__file__), '..', 'debug')
+            debug_dir = os.path.join(parent_dir, 'debug')
             if os.path.exists(debug_dir):
                 for filename in os.listdir(debug_dir):
                     if filename.endswith('.log'):
@@ -2030,6 +2125,8 @@ To stop receiving these emails, uncheck 'Send email notifications' in the applic
                 import shutil
                 if os.path.exists(CONFIG_DIR):
                     shutil.rmtree(CONFIG_DIR)
+                    self._config_dir_created = False
+                    self._last_written_hash = None
                     logger.info(f"Deleted config directory: {CONFIG_DIR}")
                 else:
                     logger.info("No config directory found to delete")
@@ -2062,10 +2159,17 @@ To stop receiving these emails, uncheck 'Send email notifications' in the applic
     def closeEvent(self, event):
         """Handle application close event"""
         try:
+            # Flush an auto-save that is still waiting on its timer
+            if self._auto_save_timer.isActive():
+                self._flush_auto_save()
+            
             # Stop the worker thread
             if hasattr(self, 'worker_thread'):
                 self.worker_thread.stop()
             
+            # Don't wait here; an email already being sent still finishes before the process exits
+            self._email_pool.shutdown(wait=False)
+            
             event.accept()
         except Exception as e:
             logger.error(f"Error during close: {str(e)}")
@@ -2106,25 +2210,7 @@ def main():
     os.environ['QT_PLUGIN_PATH'] = r'C:\Users\benos\anaconda3\Library\plugins'
     os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = r'C:\Users\benos\anaconda3\Library\plugins\platforms'
     
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')  # Use Fusion style for better dark theme support
-    
-    # Set application properties
-    app.setApplicationName("Commercial Real Estate Crawler")
-    app.setApplicationVersion("3.0")
-    app.setOrganizationName("Commercial Real Estate Tools")
-    
-    # Set application icon (for taskbar and window)
-    # Check if running as executable (PyInstaller)
-    if getattr(sys, 'frozen', False):
-        # Running as executable - icon is bundled in the same directory as exe
-        icon_path = os.path.join(sys._MEIPASS, 'v3icon.ico')
-    else:
-        # Running as script - icon is in project root
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'v3icon.ico')
-    
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    app = create_application()
     
     window = MainWindow(auto_save=auto_save)
     window.show()
@@ -28,7 +28,6 @@ setup(
         'PyQt5>=5.15.0',
         'selenium>=4.0.0',
         'pywin32>=300',
-        'schedule>=1.1.0',
         'beautifulsoup4>=4.10.0',
     ],
     python_requires='>=3.8',
@@ -11,14 +11,41 @@ import time
 import argparse
 from pathlib import Path
 
-# Add project root to path for imports
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, project_root)
+# Add project root to path for imports (resolved once; reused by the install snippet)
+PROJECT_ROOT = str(Path(__file__).resolve().parent)
+sys.path.insert(0, PROJECT_ROOT)
 
 from debug.logger import setup_logger
 
 logger = setup_logger('gui_launcher')
 
+SERVICE_NAME = "CommercialRealEstateScraper"
+
+# Service control goes through pywin32 in-process when it is available;
+# the sc/net command line tools are only used as a fallback.
+try:
+    import win32service
+    import win32serviceutil
+except ImportError:
+    win32service = None
+    win32serviceutil = None
+
+# Win32 error code returned when the named service is not installed
+ERROR_SERVICE_DOES_NOT_EXIST = 1060
+
+# Python snippet run by an elevated interpreter to install the service
+_INSTALL_SNIPPET = (
+    f"import sys; sys.path.append(r'{PROJECT_ROOT}'); "
+    "from service.service import ScraperService; import win32serviceutil; "
+    "win32serviceutil.HandleCommandLine(ScraperService, argv=['', 'install'])"
+)
+
+# Last (installed, running) tuple that was logged
+_last_service_status = None
+
+# ASCII lowercase table for scanning raw `sc query` output without decoding it
+_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
 def is_admin():
     """Check if the current process has admin privileges"""
     try:
@@ -28,29 +55,21 @@ def is_admin():
         return False
 
 def run_as_admin(cmd):
-    """Run a command with admin privileges"""
-    if isinstance(cmd, list):
-        cmd = ' '.join(cmd)
+    """Run a command (argv list) with admin privileges"""
+    if isinstance(cmd, str):
+        cmd = [cmd]
     
     try:
-        logger.info(f"Running with admin privileges: {cmd}")
-        if is_admin():
+        admin = is_admin()
+        logger.info(f"Running with admin privileges ({'direct' if admin else 'elevated'}): {subprocess.list2cmdline(cmd)}")
+        if admin:
             # Already admin, just run the command directly
-            logger.info("Already admin, running directly")
-            return subprocess.run(cmd, shell=True, check=True)
+            return subprocess.run(cmd, check=True, creationflags=subprocess.CREATE_NO_WINDOW)
         else:
-            # Need to elevate - use ShellExecute directly with the command
-            logger.info("Not admin, elevating privileges")
-            if cmd.startswith('-c'):
-                # For Python commands, use sys.executable
-                ctypes.windll.shell32.ShellExecuteW(
-                    None, "runas", sys.executable, cmd, None, 1
-                )
-            else:
-                # For system commands like 'net start', use cmd.exe
-                ctypes.windll.shell32.ShellExecuteW(
-                    None, "runas", "cmd.exe", f"/c {cmd}", None, 1
-                )
+            # Need to elevate - ShellExecute takes a command-line string
+            ctypes.windll.shell32.ShellExecuteW(
+                None, "runas", cmd[0], subprocess.list2cmdline(cmd[1:]), None, 1
+            )
         return True
     except Exception as e:
         logger.error(f"Error running as admin: {e}")
@@ -58,49 +77,81 @@ def run_as_admin(cmd):
 
 def check_service_status():
     """Check if the service is installed and running"""
+    global _last_service_status
+    
+    status = _query_service_status()
+    if status != _last_service_status:
+        logger.info(f"Service status: installed={status[0]}, running={status[1]}")
+        _last_service_status = status
+    return status
+
+def _query_service_status():
+    """Return the (installed, running) tuple for the service"""
+    if win32serviceutil is not None:
+        try:
+            status = win32serviceutil.QueryServiceStatus(SERVICE_NAME)
+            return True, status[1] == win32service.SERVICE_RUNNING
+        except Exception as e:
+            if getattr(e, 'winerror', None) == ERROR_SERVICE_DOES_NOT_EXIST:
+                return False, False
+            logger.error(f"Error querying service status: {str(e)}")
+            return False, False
+    
     try:
         # Use SC command to check service status
         process = subprocess.run(
-            ["sc", "query", "CommercialRealEstateScraper"], 
+            ["sc", "query", SERVICE_NAME], 
             stdout=subprocess.PIPE, 
             stderr=subprocess.PIPE,
-            text=True, 
             creationflags=subprocess.CREATE_NO_WINDOW
         )
         
-        output = process.stdout.lower()
-        logger.debug(f"Service status raw output: {output}")
+        output = process.stdout.translate(_LOWER)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Service status raw output: {output!r}")
         
         # Check if service is installed
-        installed = "commercialrealestate" in output and "specified service does not exist" not in output
+        installed = b"commercialrealestate" in output and b"specified service does not exist" not in output
         
         # Check if service is running
-        running = "running" in output
+        running = b"running" in output
         
-        # Removed service status logging since we're using Task Scheduler now
-        # logger.info(f"Service status: installed={installed}, running={running}")
         return installed, running
     
     except Exception as e:
         logger.error(f"Error checking service status: {str(e)}")
         return False, False
 
-def install_service():
-    """Install the Windows service with admin elevation"""
+def begin_service_install():
+    """Start installing the Windows service without waiting for it.
+    
+    Returns True when the install already finished in-process (admin), False when
+    an elevated interpreter was launched and is still running.
+    """
     logger.info("Installing service...")
     
+    # The service itself is built on pywin32, so there is nothing to install without it;
+    # report the install as finished and let the status check show that it failed
+    if win32serviceutil is None:
+        logger.error("Cannot install the service: pywin32 is unavailable")
+        return True
+    
+    if is_admin():
+        # Already admin, install in-process instead of spawning Python
+        from service.service import ScraperService
+        win32serviceutil.HandleCommandLine(ScraperService, argv=['', 'install'])
+        return True
+    
+    # Elevate a separate interpreter to run the install snippet
+    run_as_admin([sys.executable, "-c", _INSTALL_SNIPPET])
+    return False
+
+def install_service():
+    """Install the Windows service with admin elevation"""
     try:
-        # Get path to current directory and service module
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        # Command to install service
-        install_cmd = f'-c "import sys; sys.path.append(r\'{current_dir}\'); from service.service import ScraperService; import win32serviceutil; win32serviceutil.HandleCommandLine(ScraperService, argv=[\'\', \'install\'])"'
-        
-        # Run the command with admin privileges
-        success = run_as_admin(install_cmd)
-        
-        # Add a delay to wait for installation
-        time.sleep(2)
+        if not begin_service_install():
+            # Add a delay to wait for installation
+            time.sleep(2)
         
         # Check if it was successful
         installed, _ = check_service_status()
@@ -115,17 +166,26 @@ def start_service():
     logger.info("Starting service...")
     
     try:
-        if is_admin():
+        output_file = None
+        admin = is_admin()
+        
+        if admin and win32serviceutil is not None:
+            # Already admin, start the service in-process
+            try:
+                win32serviceutil.StartService(SERVICE_NAME)
+                logger.debug("Service start command returned successfully")
+            except Exception as e:
+                logger.error(f"Exception starting service directly: {str(e)}")
+                
+        elif admin:
             # Already admin, run the command directly and capture output
-            logger.info("Already admin, running net start directly")
-            
             try:
                 result = subprocess.run(
-                    "net start CommercialRealEstateScraper", 
-                    shell=True, 
+                    ["net", "start", SERVICE_NAME], 
                     capture_output=True,
                     text=True,
-                    check=False  # Don't raise exception so we can log the error
+                    check=False,  # Don't raise exception so we can log the error
+                    creationflags=subprocess.CREATE_NO_WINDOW
                 )
                 
                 if result.returncode != 0:
@@ -134,17 +194,13 @@ def start_service():
                         logger.error(f"Error output: {result.stderr}")
                     if result.stdout:
                         logger.error(f"Standard output: {result.stdout}")
-                else:
-                    logger.info("Service start command returned successfully")
-                    if result.stdout:
-                        logger.info(f"Service start output: {result.stdout}")
+                elif logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Service start output: {result.stdout}")
             except Exception as e:
                 logger.error(f"Exception running net start directly: {str(e)}")
                 
         else:
             # Need to elevate - use ShellExecute directly with the command
-            logger.info("Not admin, elevating privileges for net start")
-            
             # Create a script to capture the output after elevation
             temp_dir = os.environ.get('TEMP', '')
             output_file = os.path.join(temp_dir, 'service_start_output.txt')
@@ -154,7 +210,7 @@ def start_service():
             with open(batch_file, 'w') as f:
                 f.write(f'@echo off\n')
                 f.write(f'echo Starting service at %time% >> "{output_file}"\n')
-                f.write(f'net start CommercialRealEstateScraper >> "{output_file}" 2>&1\n')
+                f.write(f'net start {SERVICE_NAME} >> "{output_file}" 2>&1\n')
                 f.write(f'echo Exit code: %errorlevel% >> "{output_file}"\n')
                 f.write(f'pause\n')
             
@@ -172,7 +228,7 @@ def start_service():
         installed, running = check_service_status()
         
         # If not running, try to read the output file if it exists
-        if not running and os.path.exists(output_file):
+        if not running and output_file and os.path.exists(output_file):
             try:
                 with open(output_file, 'r') as f:
                     output = f.read()
@@ -186,48 +242,53 @@ def start_service():
         logger.error(f"Error starting service: {str(e)}", exc_info=True)
         return False
 
+def _show_install_result():
+    """Report the outcome of an install started from prompt_service_install_only"""
+    from PyQt5.QtWidgets import QMessageBox
+    
+    installed, _ = check_service_status()
+    if installed:
+        QMessageBox.information(
+            None,
+            "Service Installed",
+            "The service was installed successfully.\n\n"
+            "Note: The service is not started automatically.\n"
+            "You can start it manually from the Service Control panel in the application."
+        )
+    else:
+        QMessageBox.warning(
+            None,
+            "Installation Issue",
+            "There may have been an issue with the installation.\n\n"
+            "Check the logs for more details."
+        )
+
 def prompt_service_install_only():
     """Prompt user with GUI dialog to install the service if needed, but don't prompt to start it"""
-    # Import PyQt here to avoid circular imports
-    from PyQt5.QtWidgets import QApplication, QMessageBox
-    
     try:
-        # Create a temporary QApplication instance if needed
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
-        
         installed, running = check_service_status()
         
-        if not installed:
-            result = QMessageBox.question(
-                None, 
-                "Service Not Installed",
-                "The Real Estate Crawler service is not installed.\n\n"
-                "Would you like to install it now? (Requires admin privileges)",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if result == QMessageBox.Yes:
-                success = install_service()
-                
-                if success:
-                    QMessageBox.information(
-                        None,
-                        "Service Installed",
-                        "The service was installed successfully.\n\n"
-                        "Note: The service is not started automatically.\n"
-                        "You can start it manually from the Service Control panel in the application."
-                    )
-                else:
-                    QMessageBox.warning(
-                        None,
-                        "Installation Issue",
-                        "There may have been an issue with the installation.\n\n"
-                        "Check the logs for more details."
-                    )
-        
+        # Nothing to ask when the service is already installed, so skip loading QtWidgets
         # We don't prompt to start the service anymore, even if it's installed but not running
+        if installed:
+            return
+        
+        # Import PyQt here to avoid circular imports
+        from PyQt5.QtCore import QTimer
+        from PyQt5.QtWidgets import QMessageBox
+        
+        result = QMessageBox.question(
+            None, 
+            "Service Not Installed",
+            "The Real Estate Crawler service is not installed.\n\n"
+            "Would you like to install it now? (Requires admin privileges)",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if result == QMessageBox.Yes:
+            # Don't block the UI thread while the elevated install runs; report from the event loop
+            finished = begin_service_install()
+            QTimer.singleShot(0 if finished else 2000, _show_install_result)
     
     except Exception as e:
         logger.error(f"Error during service install prompt: {str(e)}")
@@ -263,16 +324,10 @@ def main():
         if not args.debug:
             os.environ['QT_LOGGING_RULES'] = '*.debug=false;qt.qpa.*=false'
         
-        # Try to import PyQt5 first to make sure it's available
-        from PyQt5.QtWidgets import QApplication, QMessageBox
-        
-        # Import the GUI application and pass debug flag
-        from gui.app import MainWindow
+        # Import the GUI application; it owns the shared QApplication setup
+        from gui.app import MainWindow, create_application
         
-        # Create and run the application
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
+        app = create_application()
         
         window = MainWindow(debug_mode=args.debug, auto_save=args.auto_save)
         window.show()
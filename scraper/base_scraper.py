@@ -1,275 +1,1193 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, TYPE_CHECKING
 from datetime import datetime
 import time
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
+import sys
+import re
 import random
+import atexit
+import threading
+import functools
+import collections
+
+# Selenium is imported inside the methods that use it, so importing this module stays cheap
+if TYPE_CHECKING:
+    from selenium.webdriver.support.ui import WebDriverWait
+
+# How often explicit waits re-check their condition, in seconds
+WAIT_POLL_FREQUENCY = 0.05
+
+# Polling interval bounds for the stable wait's fallback loop: it starts fast and backs
+# off while nothing changes, resetting whenever the count moves
+STABLE_POLL_MIN = 0.02
+STABLE_POLL_MAX = 0.2
+
+def _minify_js(source: str) -> str:
+    """Drop comment lines, indentation and blank lines from a JavaScript snippet
+    
+    Applied once at import, so the scripts stay readable here but each call sends
+    the compact form. Line breaks are kept so statements without semicolons still parse.
+    """
+    lines = (line.strip() for line in source.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+# Removes blocking modal overlays (leaving the filters modal alone) and returns how many
+# were removed; evaluated through CDP so it skips the WebDriver execute/sync endpoint
+_REMOVE_OVERLAYS_JS = _minify_js("""
+(function() {
+    var removed = 0;
+    
+    // Only remove overlays that are not the filters modal
+    var overlays = document.querySelectorAll('div.csgp-modal-overlay, div.csgp-modal.ng-isolate-scope');
+    overlays.forEach(function(overlay) {
+        // Skip the filters modal
+        if (!overlay.classList.contains('advanced-filters-modal')) {
+            overlay.remove();
+            removed++;
+        }
+    });
+    
+    // Remove any fixed position elements that might block interaction
+    // but not if they're part of the filters modal
+    var fixedElements = document.querySelectorAll('div[style*="position: fixed"]');
+    fixedElements.forEach(function(element) {
+        if (!element.closest('.advanced-filters-modal')) {
+            element.remove();
+            removed++;
+        }
+    });
+    
+    // Ensure body is scrollable unless filters modal is open
+    if (!document.querySelector('.advanced-filters-modal')) {
+        document.body.style.overflow = 'auto';
+        document.body.style.position = 'relative';
+        document.body.style.height = 'auto';
+    }
+    
+    return removed;
+})()
+""")
+
+# Registered on every new document: removes the blocking modal overlays as they are
+# inserted, looking only at the added nodes, so clicks don't have to sweep first.
+# Generic fixed-position elements are left to _remove_overlays, since widgets such
+# as autocomplete lists can be fixed-position too
+_OVERLAY_OBSERVER_JS = _minify_js("""
+(function() {
+    var OVERLAY_SELECTOR = 'div.csgp-modal-overlay, div.csgp-modal.ng-isolate-scope';
+    
+    function removeOverlay(overlay) {
+        // Skip the filters modal
+        if (overlay.classList.contains('advanced-filters-modal')) return false;
+        overlay.remove();
+        return true;
+    }
+    
+    new MutationObserver(function(mutations) {
+        var removed = false;
+        mutations.forEach(function(mutation) {
+            mutation.addedNodes.forEach(function(node) {
+                if (node.nodeType !== 1) return;
+                if (node.matches(OVERLAY_SELECTOR)) {
+                    removed = removeOverlay(node) || removed;
+                } else if (node.firstElementChild) {
+                    // Overlays can also arrive inside an inserted container
+                    node.querySelectorAll(OVERLAY_SELECTOR).forEach(function(overlay) {
+                        removed = removeOverlay(overlay) || removed;
+                    });
+                }
+            });
+        });
+        
+        // Undo the scroll lock the modal put on the body, unless the filters modal is open
+        if (removed && document.body && !document.querySelector('.advanced-filters-modal')) {
+            document.body.style.overflow = 'auto';
+            document.body.style.position = 'relative';
+            document.body.style.height = 'auto';
+        }
+    }).observe(document, {childList: true, subtree: true});
+})();
+""")
+
+# Finds the element for a selector, scrolls it into view and returns it if it has a size
+# and isn't disabled (null otherwise) - one round trip per poll instead of a lookup,
+# a displayed check and an enabled check
+_LOCATE_INTERACTABLE_JS = _minify_js("""
+var element = document.querySelector(arguments[0]);
+if (!element) return null;
+element.scrollIntoView({block: 'center', behavior: 'instant'});
+var rect = element.getBoundingClientRect();
+if (rect.width === 0 || rect.height === 0 || element.disabled) return null;
+return element;
+""")
+
+# Async version of the check above: resolves with the element as soon as a DOM mutation
+# (or, for CSS transitions, a 100ms fallback tick) makes it interactable, or with null
+# after arguments[1] milliseconds - one round trip for the whole wait
+_WAIT_INTERACTABLE_JS = _minify_js("""
+var selector = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var finished = false, observer = null, tick = null, timer = null;
+
+function interactable() {
+    var element = document.querySelector(selector);
+    if (!element || element.disabled) return null;
+    var rect = element.getBoundingClientRect();
+    return (rect.width === 0 || rect.height === 0) ? null : element;
+}
+
+function finish(element) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(tick);
+    clearTimeout(timer);
+    if (element) element.scrollIntoView({block: 'center', behavior: 'instant'});
+    done(element);
+}
+
+function check() {
+    var element = interactable();
+    if (element) finish(element);
+}
+
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+    tick = setInterval(check, 100);
+    timer = setTimeout(function() { finish(null); }, timeoutMs);
+}
+""")
+
+# Resolves with the match count for selector arguments[0] once it has stayed unchanged (and
+# at least arguments[2]) for arguments[1] milliseconds, or null after arguments[3] milliseconds
+_WAIT_STABLE_JS = _minify_js("""
+var selector = arguments[0], stableMs = arguments[1], minCount = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var count = document.querySelectorAll(selector).length, lastChange = performance.now();
+
+function recount() {
+    var current = document.querySelectorAll(selector).length;
+    if (current !== count) {
+        count = current;
+        lastChange = performance.now();
+    }
+}
+
+function finish(result) {
+    observer.disconnect();
+    clearInterval(tick);
+    clearTimeout(timer);
+    done(result);
+}
+
+var observer = new MutationObserver(recount);
+observer.observe(document, {childList: true, subtree: true});
+var tick = setInterval(function() {
+    if (count >= minCount && performance.now() - lastChange >= stableMs) finish(count);
+}, 50);
+var timer = setTimeout(function() { finish(null); }, timeoutMs);
+""")
+
+# Counts the page's in-flight fetch and XMLHttpRequest calls in window.__scraperPendingRequests
+# and stamps window.__scraperRequestActivity whenever one starts or ends; registered to run
+# before any page script so the network-idle wait can see requests that haven't finished
+_REQUEST_TRACKER_JS = _minify_js("""
+(function() {
+    if (window.__scraperPendingRequests !== undefined) return;
+    window.__scraperPendingRequests = 0;
+    window.__scraperRequestActivity = performance.now();
+    
+    function started() {
+        window.__scraperPendingRequests++;
+        window.__scraperRequestActivity = performance.now();
+    }
+    
+    function ended() {
+        window.__scraperPendingRequests = Math.max(0, window.__scraperPendingRequests - 1);
+        window.__scraperRequestActivity = performance.now();
+    }
+    
+    if (window.fetch) {
+        var nativeFetch = window.fetch;
+        window.fetch = function() {
+            started();
+            var request;
+            try {
+                request = nativeFetch.apply(this, arguments);
+            } catch (error) {
+                ended();
+                throw error;
+            }
+            return request.then(function(response) {
+                ended();
+                return response;
+            }, function(error) {
+                ended();
+                throw error;
+            });
+        };
+    }
+    
+    var nativeSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        started();
+        this.addEventListener('loadend', ended);
+        try {
+            return nativeSend.apply(this, arguments);
+        } catch (error) {
+            this.removeEventListener('loadend', ended);
+            ended();
+            throw error;
+        }
+    };
+})();
+""")
+
+# Resolves true once no fetch/XHR request is in flight and none has started or ended (and
+# no other resource has finished loading) for arguments[0] milliseconds, or false after
+# arguments[1] milliseconds; relies on the counters kept by _REQUEST_TRACKER_JS
+_NETWORK_IDLE_JS = _minify_js("""
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var lastResource = performance.now(), finished = false;
+var observer = new PerformanceObserver(function() { lastResource = performance.now(); });
+observer.observe({entryTypes: ['resource']});
+
+function finish(idle) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearInterval(tick);
+    clearTimeout(timer);
+    done(idle);
+}
+
+var tick = setInterval(function() {
+    if (document.readyState === 'loading' || (window.__scraperPendingRequests || 0) > 0) return;
+    var lastActivity = Math.max(lastResource, window.__scraperRequestActivity || 0);
+    if (performance.now() - lastActivity >= quietMs) finish(true);
+}, 50);
+var timer = setTimeout(function() { finish(false); }, timeoutMs);
+""")
+
+# Empties an input's value
+_CLEAR_VALUE_JS = "arguments[0].value = '';"
+
+# Submits the page's first form; returns false when the page has no form
+SUBMIT_FORM_JS = "var form = document.querySelector('form'); if (form) form.submit(); return !!form;"
+
+# Reads fields from every row matching arguments[0] in one pass; arguments[1] holds
+# [name, selector, attribute] triples (empty selector = the row, empty attribute = text)
+_EXTRACT_BATCH_JS = _minify_js("""
+var rows = document.querySelectorAll(arguments[0]), fields = arguments[1];
+return Array.prototype.map.call(rows, function(row) {
+    var record = {};
+    fields.forEach(function(field) {
+        var element = field[1] ? row.querySelector(field[1]) : row;
+        if (!element) {
+            record[field[0]] = null;
+        } else if (field[2]) {
+            // Prefer the DOM property (absolute href, live value) like get_attribute does
+            var value = element[field[2]];
+            record[field[0]] = (value === undefined || value === null || typeof value === 'object')
+                ? element.getAttribute(field[2]) : String(value);
+        } else {
+            record[field[0]] = element.innerText.trim();
+        }
+    });
+    return record;
+});
+""")
+
+# Upper bound for async scripts; in-page waits time themselves out well before this
+ASYNC_SCRIPT_TIMEOUT = 60
+
+# Seconds input_text_with_wait waits for a field to show the entered text
+INPUT_SETTLE_TIMEOUT = 1
+
+# Characters ignored when checking a field's value against the entered text, so fields
+# that reformat it (thousands separators, date slashes) still count as filled
+_VALUE_FORMATTING_RE = re.compile(r'[\W_]+')
+
+# Seconds to wait before the first click retry; later retries wait proportionally longer
+CLICK_RETRY_DELAY = 0.1
+
+# Scrolls the element into view if needed and clicks it unless it has no size or is
+# disabled, first sweeping overlays when arguments[1] is true; returns 'ok', 'invisible',
+# 'disabled' or the message of an error thrown by the click
+_SCROLL_AND_CLICK_JS = _minify_js("""
+var element = arguments[0];
+if (arguments[1]) """ + _REMOVE_OVERLAYS_JS.strip() + """;
+try {
+    // Only scroll when the element isn't already fully in the viewport
+    var rect = element.getBoundingClientRect();
+    if (rect.top < 0 || rect.left < 0 || rect.bottom > window.innerHeight || rect.right > window.innerWidth) {
+        element.scrollIntoView({block: 'center', behavior: 'instant'});
+        rect = element.getBoundingClientRect();
+    }
+    if (rect.width === 0 || rect.height === 0) return 'invisible';
+    if (element.disabled) return 'disabled';
+    element.click();
+    return 'ok';
+} catch (e) {
+    return e.message;
+}
+""")
+
+# Clicks every selector in arguments[0] that matches; returns {selector: clicked}
+_CLICK_ALL_JS = _minify_js("""
+var results = {};
+arguments[0].forEach(function(selector) {
+    try {
+        var element = document.querySelector(selector);
+        if (element) {
+            element.scrollIntoView({block: 'center'});
+            element.click();
+            results[selector] = true;
+        } else {
+            results[selector] = false;
+        }
+    } catch (err) {
+        results[selector] = false;
+    }
+});
+return results;
+""")
+
+# Image requests, left unblocked for scrapers created with enable_images
+IMAGE_URL_PATTERNS = ('*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif', '*.svg')
+
+# Requests Chrome skips outside debug mode: listing data is text, so images, media,
+# webfonts and analytics/ad scripts are just bytes on the wire
+BLOCKED_URL_PATTERNS = list(IMAGE_URL_PATTERNS) + [
+    '*.woff', '*.woff2', '*.ttf', '*.mp4',
+    '*google-analytics*', '*doubleclick*', '*facebook.net*',
+    '*hotjar.com*', '*segment.io*'
+]
+
+# Connections kept open to chromedriver (urllib3 defaults to a single pooled connection)
+DRIVER_CONNECTION_POOL_SIZE = 4
+
+# Consecutive overlay sweeps that remove nothing before a scraper stops sweeping
+OVERLAY_EMPTY_SWEEP_LIMIT = 3
+
+# User agent presented to sites instead of the headless default
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+# Chrome command line flags shared by every driver (headless is added per scraper)
+_CHROME_ARGS = (
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-logging',
+    '--log-level=3',
+    '--window-size=1920,1080',
+    f'--user-agent={USER_AGENT}',
+    '--disable-blink-features=AutomationControlled',
+    '--enable-unsafe-swiftshader',
+    
+    # Suppress voice transcription and accessibility logs. Chrome only honours the
+    # last --disable-features switch, so the features must share a single flag
+    '--disable-features=VizDisplayCompositor,TranslateUI,VoiceTranscription',
+    '--disable-accessibility-logging',
+    '--disable-speech-api',
+    '--suppress-message-center-popups',
+)
+
+# Chrome content settings shared by every driver (2 = block)
+_CHROME_PREFS = {
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.managed_default_content_settings.plugins': 2
+}
+
+# Headless browsers kept alive between scrapes in the same process
+DRIVER_POOL_SIZE = 2
+
+# Seconds a pooled browser may sit unused before it is quit
+DRIVER_POOL_IDLE_TIMEOUT = 300
+
+# Seconds a driver kept between searches (inside a with block) may sit unused before closing
+DRIVER_IDLE_TIMEOUT = 120
+
+class _DriverPool:
+    """Idle headless Chrome drivers kept warm so the next scraper skips browser startup
+    
+    A driver left in the pool for idle_timeout seconds is quit, so a long-running
+    process (the GUI) doesn't keep browsers open between infrequent scrapes.
+    """
+    
+    def __init__(self, max_idle: int, idle_timeout: float):
+        self._max_idle = max_idle
+        self._idle_timeout = idle_timeout
+        self._idle = collections.deque()  # (driver, time parked), oldest first
+        self._lock = threading.Lock()
+        self._expiry_timer = None  # Quits the oldest driver once it has expired
+        atexit.register(self.close_all)
+    
+    def get(self):
+        """Return the most recently parked driver, or None if there is none"""
+        with self._lock:
+            if not self._idle:
+                return None
+            # Newest first, so the older drivers are the ones left to expire
+            return self._idle.pop()[0]
+    
+    def put(self, driver) -> bool:
+        """Park a driver for reuse; returns False if the pool is full"""
+        with self._lock:
+            if len(self._idle) >= self._max_idle:
+                return False
+            self._idle.append((driver, time.monotonic()))
+            self._schedule_expiry()
+            return True
+    
+    def _schedule_expiry(self) -> None:
+        """Start the expiry timer for the oldest parked driver (lock held)"""
+        if self._expiry_timer is not None or not self._idle:
+            return
+        delay = self._idle[0][1] + self._idle_timeout - time.monotonic()
+        self._expiry_timer = threading.Timer(max(delay, 0), self._expire)
+        self._expiry_timer.daemon = True
+        self._expiry_timer.start()
+    
+    def _expire(self) -> None:
+        """Quit the drivers that have been parked longer than the idle timeout"""
+        expired = []
+        with self._lock:
+            self._expiry_timer = None
+            cutoff = time.monotonic() - self._idle_timeout
+            while self._idle and self._idle[0][1] <= cutoff:
+                expired.append(self._idle.popleft()[0])
+            self._schedule_expiry()
+        self._quit_all(expired)
+    
+    def close_all(self) -> None:
+        """Quit every idle driver"""
+        with self._lock:
+            if self._expiry_timer is not None:
+                self._expiry_timer.cancel()
+                self._expiry_timer = None
+            drivers = [driver for driver, _ in self._idle]
+            self._idle.clear()
+        self._quit_all(drivers)
+    
+    @staticmethod
+    def _quit_all(drivers) -> None:
+        """Quit drivers, ignoring ones that are already gone"""
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+_driver_pool = _DriverPool(DRIVER_POOL_SIZE, DRIVER_POOL_IDLE_TIMEOUT)
+
+# Expected-condition factories by smart_wait condition name
+_CSS_CONDITIONS = {
+    "presence": "presence_of_element_located",
+    "visible": "visibility_of_element_located",
+    "clickable": "element_to_be_clickable",
+}
+
+@functools.lru_cache(maxsize=256)
+def _css_condition(kind: str, selector: str):
+    """Return a cached expected condition for a CSS selector
+    
+    The conditions hold only the locator, so one instance can serve every wait
+    on the same selector instead of being rebuilt on each call and retry.
+    
+    Args:
+        kind: "presence", "visible" or "clickable"
+        selector: CSS selector
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    
+    return getattr(EC, _CSS_CONDITIONS[kind])((By.CSS_SELECTOR, selector))
 
 class BaseScraper(ABC):
     """Base scraper class for real estate websites"""
     
-    def __init__(self, debug_mode: bool = False):
+    # Request URL patterns Chrome blocks outside debug mode; subclasses may override
+    BLOCKED_URL_PATTERNS = BLOCKED_URL_PATTERNS
+    
+    def __init__(self, debug_mode: bool = False, enable_images: bool = False):
         """Initialize the scraper
         
         Args:
             debug_mode: Whether to run in debug mode (shows browser)
+            enable_images: Whether headless runs should load and render images
+                (not needed to read <img src> attributes)
         """
         self.debug_mode = debug_mode
+        self.enable_images = enable_images
         self.driver = None
         self.wait_time = 10  # Default wait time in seconds
         self.logger = None
         self.base_url = None  # Should be set by child classes
+        self._waits = {}  # timeout -> WebDriverWait bound to the current driver
+        self.keep_driver = False  # Keep the driver between searches (set by the with statement)
+        self.idle_timeout = DRIVER_IDLE_TIMEOUT  # Seconds a kept driver may sit unused
+        self._idle_timer = None  # Closes a kept driver once it has been idle too long
+        self._driver_in_use = False  # A search is running on the driver
+        self._driver_lock = threading.Lock()
+        # Click methods click_element works through ('js' scroll-and-click script,
+        # 'actions' pointer click); it moves on only when a click is blocked or doesn't register.
+        # Pointer emulation is slow in headless Chrome, so it's only a fallback in debug mode
+        self.click_strategies = ['js', 'actions'] if debug_mode else ['js']
+        self.human_delay_jitter = 0.0  # Max random pause (s) after waits; raise only for anti-bot pacing
+        self.has_overlays = True  # Set False for sites that never show blocking overlays
+        self._empty_overlay_sweeps = 0  # Consecutive overlay sweeps that found nothing
+        
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_options(debug_mode: bool, enable_images: bool):
+        """Build the Chrome options for a driver configuration, once per process
+        
+        Args:
+            debug_mode: Whether the browser is shown (no headless flag, images on)
+            enable_images: Whether headless browsers should load images
+            
+        Returns:
+            ChromeOptions shared by every driver with this configuration (don't modify)
+        """
+        from selenium import webdriver
         
-    def _setup_driver(self) -> None:
-        """Set up the Chrome WebDriver with appropriate options."""
         options = webdriver.ChromeOptions()
-        if not self.debug_mode:
+        if not debug_mode:
             options.add_argument('--headless=new')  # Use new headless mode
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-logging')
-        options.add_argument('--log-level=3')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--start-maximized')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--enable-unsafe-swiftshader')
-        
-        # Suppress voice transcription and accessibility logs
-        options.add_argument('--disable-features=VizDisplayCompositor')
-        options.add_argument('--disable-features=TranslateUI')
-        options.add_argument('--disable-features=VoiceTranscription')
-        options.add_argument('--disable-accessibility-logging')
-        options.add_argument('--disable-speech-api')
-        options.add_argument('--suppress-message-center-popups')
+        for argument in _CHROME_ARGS:
+            options.add_argument(argument)
         
         options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Block notification prompts and plugins, and skip images unless the browser is
+        # being watched or the scraper asked for them
+        prefs = dict(_CHROME_PREFS)
+        if not debug_mode and not enable_images:
+            prefs['profile.managed_default_content_settings.images'] = 2
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', prefs)
+        
+        # Return from driver.get() at DOMContentLoaded instead of waiting for onload;
+        # callers wait explicitly for the elements they need
+        options.page_load_strategy = 'eager'
+        return options
+    
+    def _setup_driver(self) -> None:
+        """Set up the Chrome WebDriver with appropriate options."""
+        from selenium import webdriver
+        
+        self._waits.clear()
+        
+        # Reuse a warm headless browser when one is parked in the pool (pooled browsers
+        # all use the default, image-free configuration)
+        if self._uses_pool():
+            self.driver = self.acquire_driver()
+            if self.driver is not None:
+                return
+        
+        options = self._build_options(self.debug_mode, self.enable_images)
+        
         # Create service with suppressed output
         service = webdriver.ChromeService(log_output=os.devnull)
         
-        # Create the driver with the configured options and service
-        self.driver = webdriver.Chrome(options=options, service=service)
-        self.driver.set_window_size(1920, 1080)
-        self.driver.implicitly_wait(self.wait_time)
+        # Create the driver with the configured options and service, reusing one
+        # HTTP connection to chromedriver for every command
+        self.driver = webdriver.Chrome(options=options, service=service, keep_alive=True)
         
-        # Execute CDP commands to prevent detection
-        self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-        })
+        # Let the command connection pool hold more than one idle connection, so a
+        # command issued while another is in flight doesn't open and drop a new socket
+        pool_manager = getattr(self.driver.command_executor, '_conn', None)
+        if pool_manager is not None:
+            pool_manager.connection_pool_kw['maxsize'] = DRIVER_CONNECTION_POOL_SIZE
+            pool_manager.clear()
+        
+        # Explicit waits only; an implicit wait would stretch every lookup they poll
+        self.driver.implicitly_wait(0)
+        self.driver.set_script_timeout(ASYNC_SCRIPT_TIMEOUT)
+        
+        # Remove modal overlays as they appear on every page, instead of before each interaction
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _OVERLAY_OBSERVER_JS})
+        
+        # Count in-flight fetch/XHR requests on every page for the network-idle wait
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _REQUEST_TRACKER_JS})
+        
+        # Skip downloading resources the scrapers never read (kept in debug mode so the page looks right)
+        if not self.debug_mode:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            blocked_urls = list(self.BLOCKED_URL_PATTERNS)
+            if self.enable_images:
+                blocked_urls = [pattern for pattern in blocked_urls if pattern not in IMAGE_URL_PATTERNS]
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+    
+    def _get_wait(self, timeout: float) -> "WebDriverWait":
+        """Return a WebDriverWait for the current driver, reusing one per timeout
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            WebDriverWait: Wait polling every WAIT_POLL_FREQUENCY seconds
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            from selenium.webdriver.support.ui import WebDriverWait
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+            self._waits[timeout] = wait
+        return wait
+    
+    def _locate_interactable(self, selector: str, timeout: float):
+        """Wait for an element to be visible and enabled, scrolled into view
+        
+        Args:
+            selector: CSS selector for the element
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            WebElement if it became interactable within the timeout, None otherwise
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
+        # Wait in the page with a MutationObserver, answering in a single round trip
+        start_time = time.monotonic()
+        try:
+            return self.driver.execute_async_script(_WAIT_INTERACTABLE_JS, selector, int(timeout * 1000))
+        except WebDriverException as e:
+            # The document can be replaced mid-wait (navigation); fall back to polling
+            if self.logger:
+                self.logger.debug(f"In-page wait for {selector} interrupted, polling instead: {str(e)}")
+        
+        # Poll only for what is left of the timeout (a one-off wait, so it isn't cached
+        # in _waits under an arbitrary remaining time)
+        remaining = timeout - (time.monotonic() - start_time)
+        if remaining <= 0:
+            return None
+        try:
+            return WebDriverWait(self.driver, remaining, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda driver: driver.execute_script(_LOCATE_INTERACTABLE_JS, selector)
+            )
+        except TimeoutException:
+            return None
+    
+    def _short_find(self, selector: str, timeout: float = 1.0):
+        """Find an element that may legitimately be absent, waiting at most a short time
+        
+        Args:
+            selector: CSS selector for the element
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            The first matching WebElement, or None if nothing matched within the timeout
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            return self._get_wait(timeout).until(
+                lambda driver: next(iter(driver.find_elements(By.CSS_SELECTOR, selector)), None)
+            )
+        except TimeoutException:
+            return None
+    
+    def __enter__(self) -> "BaseScraper":
+        """Keep one driver for every search in the with block"""
+        self.keep_driver = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> bool:
+        """Close the driver kept for the with block"""
+        self.keep_driver = False
+        self.close()
+        return False
+    
+    def close(self) -> None:
+        """Close the driver now, including one kept between searches"""
+        with self._driver_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+        self._close_driver()
+    
+    def _ensure_driver(self) -> None:
+        """Get a driver ready for a search, reusing the one kept from the last search
+        
+        A kept driver is reset (tabs, cookies, site storage) so searches stay
+        isolated, and replaced if it no longer responds.
+        """
+        with self._driver_lock:
+            self._driver_in_use = True
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            
+            if self.driver is not None:
+                if self._reset_driver(self.driver):
+                    return
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+                self._waits.clear()
+        
+        self._setup_driver()
+    
+    def _finish_driver(self) -> None:
+        """Release the driver after a search
+        
+        While keep_driver is set the driver stays open for the next search and is
+        closed after idle_timeout seconds without one; otherwise it is closed now.
+        """
+        with self._driver_lock:
+            self._driver_in_use = False
+            if self.keep_driver and self.driver is not None:
+                self._idle_timer = threading.Timer(self.idle_timeout, self._close_if_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+                return
+        
+        self._close_driver()
+    
+    def _close_if_idle(self) -> None:
+        """Close the kept driver unless a search picked it up while the timer ran"""
+        with self._driver_lock:
+            if self._driver_in_use:
+                return
+            self._idle_timer = None
+            if self.logger:
+                self.logger.info(f"Closing browser after {self.idle_timeout}s without a search")
+            self._close_driver()
     
     def _close_driver(self) -> None:
         """Close the WebDriver if it exists"""
         if self.driver:
-            # In debug mode, keep window open until user input
-            if self.debug_mode:
+            # Keep the window open until user input when asked to (see holds_on_exit);
+            # otherwise close right away so threads and services never block
+            if self.holds_on_exit():
                 if self.logger:
                     self.logger.info("Debug mode: Browser window will stay open. Press Enter to close...")
                 try:
-                    input("Debug mode: Browser window will stay open. Press Enter to close...")
-                except EOFError:
-                    pass  # Handle EOFError in case running in non-interactive context
+                    self._wait_for_enter("Debug mode: Browser window will stay open. Press Enter to close...")
                 except Exception as e:
                     if self.logger:
                         self.logger.error(f"Error waiting for input: {str(e)}")
             
-            # Now close the driver
-            self.driver.quit()
+            # Now close the driver, or park it for the next scraper if it resets cleanly
+            if self._uses_pool():
+                self.release_driver(self.driver)
+            else:
+                self.driver.quit()
             self.driver = None
+            self._waits.clear()
     
-    def _remove_overlays(self) -> None:
-        """Remove any overlays using JavaScript"""
-        self.driver.execute_script("""
-            // Only remove overlays that are not the filters modal
-            var overlays = document.querySelectorAll('div.csgp-modal-overlay, div.csgp-modal.ng-isolate-scope');
-            overlays.forEach(function(overlay) {
-                // Skip the filters modal
-                if (!overlay.classList.contains('advanced-filters-modal')) {
-                    overlay.remove();
-                }
-            });
+    def holds_on_exit(self) -> bool:
+        """Whether closing the browser waits for console input
+        
+        Only in debug mode with SCRAPER_HOLD_ON_EXIT=1 (set by debug/test_scrapers.py).
+        
+        Returns:
+            bool: True if _close_driver blocks until Enter is pressed
+        """
+        return self.debug_mode and os.environ.get('SCRAPER_HOLD_ON_EXIT') == '1'
+    
+    def _uses_pool(self) -> bool:
+        """Whether this scraper's browser matches the shared pool's configuration
+        
+        Returns:
+            bool: True for headless, image-free drivers with the default block list
+        """
+        return (not self.debug_mode and not self.enable_images
+                and list(self.BLOCKED_URL_PATTERNS) == BLOCKED_URL_PATTERNS)
+    
+    @staticmethod
+    def _wait_for_enter(prompt: str) -> None:
+        """Wait for Enter on stdin without parking the calling thread inside input()
+        
+        stdin is read on a daemon thread, so the wait stays interruptible (Ctrl+C)
+        and ends at end-of-file in non-interactive runs.
+        """
+        if sys.stdin is None:
+            return
+        
+        print(prompt, flush=True)
+        pressed = threading.Event()
+        
+        def read_line():
+            try:
+                sys.stdin.readline()
+            finally:
+                pressed.set()
+        
+        threading.Thread(target=read_line, daemon=True).start()
+        while not pressed.wait(0.5):
+            pass
+    
+    @staticmethod
+    def acquire_driver():
+        """Take a warm headless driver from the shared pool
+        
+        Parked browsers can die while idle (crashed renderer, killed chrome.exe), so
+        each one is checked with a cheap command first and quit if it doesn't answer.
+        
+        Returns:
+            A live idle WebDriver, or None if the pool has none
+        """
+        while True:
+            driver = _driver_pool.get()
+            if driver is None:
+                return None
+            try:
+                driver.current_window_handle
+                return driver
+            except Exception:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+    
+    @staticmethod
+    def release_driver(driver) -> bool:
+        """Reset a headless driver and park it in the shared pool
+        
+        The driver is quit instead if it can't be reset or the pool is full.
+        
+        Args:
+            driver: WebDriver created with the default headless configuration
             
-            // Remove any fixed position elements that might block interaction
-            // but not if they're part of the filters modal
-            var fixedElements = document.querySelectorAll('div[style*="position: fixed"]');
-            fixedElements.forEach(function(element) {
-                if (!element.closest('.advanced-filters-modal')) {
-                    element.remove();
-                }
-            });
+        Returns:
+            bool: True if the driver was pooled, False if it was quit
+        """
+        if BaseScraper._reset_driver(driver) and _driver_pool.put(driver):
+            return True
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return False
+    
+    @staticmethod
+    def _reset_driver(driver) -> bool:
+        """Return a browser to a blank, cookie-free state so it can be reused
+        
+        Args:
+            driver: WebDriver to reset
             
-            // Ensure body is scrollable unless filters modal is open
-            if (!document.querySelector('.advanced-filters-modal')) {
-                document.body.style.overflow = 'auto';
-                document.body.style.position = 'relative';
-                document.body.style.height = 'auto';
-            }
-        """)
-        time.sleep(0.1)  # Quick wait for DOM updates
+        Returns:
+            bool: True if the reset succeeded
+        """
+        try:
+            # Close any extra tabs
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            
+            # Drop cookies and site storage from this run
+            origin = driver.execute_script("return window.location.origin")
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            if origin and origin != 'null':
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+            driver.get('about:blank')
+            return True
+        except Exception:
+            return False
+    
+    def _cdp_eval(self, expression: str) -> Any:
+        """Evaluate a JavaScript expression in the page through CDP
+        
+        Runtime.evaluate goes straight to the page without chromedriver wrapping the
+        script in a function and marshalling element arguments, so it suits snippets
+        that take no arguments and return plain data.
+        
+        Args:
+            expression: JavaScript expression to evaluate
+            
+        Returns:
+            Any: The expression's value (JSON-compatible), or None
+        """
+        result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True
+        })
+        return result.get('result', {}).get('value')
+    
+    def _remove_overlays(self) -> int:
+        """Remove any overlays using JavaScript
+        
+        Modal overlays are normally removed by the observer registered in _setup_driver;
+        this sweep also clears fixed-position blockers and is used when a click fails.
+        
+        Returns:
+            int: Number of overlay elements removed
+        """
+        # Sites without overlays (declared, or detected after repeated empty sweeps) skip it
+        if not self.has_overlays:
+            return 0
+        
+        removed = self._cdp_eval(_REMOVE_OVERLAYS_JS) or 0
+        if removed:
+            self._empty_overlay_sweeps = 0
+        else:
+            self._empty_overlay_sweeps += 1
+            if self._empty_overlay_sweeps >= OVERLAY_EMPTY_SWEEP_LIMIT:
+                self.has_overlays = False
+                if self.logger:
+                    self.logger.debug("No overlays found in recent sweeps, skipping overlay removal")
+        return removed
 
-    def click_element(self, selector_or_element, element_name: str = "", max_retries: int = 3) -> bool:
-        """Click an element with comprehensive retry logic and multiple click strategies
+    def click_element(self, selector_or_element, element_name: str = "", max_retries: int = 3,
+                      post_click_condition: Optional[Callable[[Any], Any]] = None,
+                      wait_for: Optional[str] = None) -> bool:
+        """Click an element with the first of click_strategies, moving to the next one
+        only when a click is intercepted
         
         Args:
             selector_or_element: Either a CSS selector string or a WebElement
             element_name: Name of the element for logging (optional)
             max_retries: Maximum number of retry attempts
+            post_click_condition: Optional WebDriverWait condition that signals the click took effect
+            wait_for: Optional CSS selector of an element the click should make appear
             
         Returns:
             bool: True if clicked successfully, False otherwise
         """
+        from selenium.webdriver.common.action_chains import ActionChains
+        from selenium.common.exceptions import (
+            ElementClickInterceptedException, ElementNotInteractableException,
+            StaleElementReferenceException, TimeoutException
+        )
+        
         # Set element description for logging
         element_desc = element_name if element_name else (
             selector_or_element if isinstance(selector_or_element, str) else "element"
         )
         
+        strategy_index = 0
+        clicked = False
         for attempt in range(max_retries):
+            strategy = self.click_strategies[strategy_index]
             try:
-                # First remove any overlays
-                self._remove_overlays()
-                # Quick delay after overlay removal
-                time.sleep(random.uniform(0.1, 0.2))
-                
                 if self.logger:
-                    self.logger.debug(f"Clicking {element_desc} (attempt {attempt+1}/{max_retries})")
+                    self.logger.debug(f"Clicking {element_desc} with {strategy} (attempt {attempt+1}/{max_retries})")
                 
                 # Get the element if a selector was provided
                 if isinstance(selector_or_element, str):
-                    # Use smart wait for clickable element
-                    if not self.smart_wait("clickable", selector_or_element, timeout=self.wait_time):
+                    element = self._locate_interactable(selector_or_element, self.wait_time)
+                    if element is None:
                         if self.logger:
                             self.logger.warning(f"Element not clickable within timeout: {element_desc}")
                         continue
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector_or_element)
                 else:
                     element = selector_or_element
                 
-                # Make sure element is in viewport
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                # Quick delay after scrolling
-                time.sleep(random.uniform(0.1, 0.2))
-                
-                # Try multiple click strategies
-                click_methods = [
-                    # Method 1: JavaScript click
-                    lambda: self.driver.execute_script("arguments[0].click();", element),
-                    # Method 2: Standard click
-                    lambda: element.click(),
-                    # Method 3: Action chains
-                    lambda: ActionChains(self.driver).move_to_element(element).click().perform()
-                ]
+                # One click per attempt. The JavaScript strategy scrolls, checks and clicks
+                # in a single call, sweeping overlays once an attempt has failed; the
+                # pointer click needs them cleared beforehand
+                if strategy == 'actions':
+                    self._remove_overlays()
+                    ActionChains(self.driver).move_to_element(element).click().perform()
+                else:
+                    result = self.driver.execute_script(_SCROLL_AND_CLICK_JS, element, attempt > 0 and self.has_overlays)
+                    if result != 'ok':
+                        raise ElementNotInteractableException(f"JavaScript click failed: {result}")
+                clicked = True
+                break
                 
-                for i, click_method in enumerate(click_methods):
-                    try:
-                        click_method()
-                        # Quick delay after click to let it register
-                        time.sleep(random.uniform(0.1, 0.2))
-                        return True
-                    except Exception as e:
-                        if i == len(click_methods) - 1:  # If this was the last method
-                            if self.logger:
-                                self.logger.warning(f"All click methods failed for {element_desc} on attempt {attempt+1}: {str(e)}")
-                            break
-                        # Otherwise continue to next method
+            except StaleElementReferenceException:
+                # The page re-rendered the element; a selector is simply located again
+                if self.logger:
+                    self.logger.warning(f"Click attempt {attempt+1} hit a stale element: {element_desc}")
+                if not isinstance(selector_or_element, str):
+                    break
                 
-                # If we reach here, all click methods failed on this attempt
-                # Quick delay before retry
-                time.sleep(random.uniform(0.1, 0.2))
+            except ElementClickInterceptedException as e:
+                # Blocked: retry straight away with the next method
+                if self.logger:
+                    self.logger.warning(f"Click attempt {attempt+1} ({strategy}) was intercepted for {element_desc}: {str(e)}")
+                strategy_index = min(strategy_index + 1, len(self.click_strategies) - 1)
                 
             except Exception as e:
                 if self.logger:
                     self.logger.warning(f"Click attempt {attempt+1} failed for {element_desc}: {str(e)}")
-                # Quick delay before retry
-                time.sleep(random.uniform(0.1, 0.2))
+                # Back off a little longer before each retry
+                time.sleep(CLICK_RETRY_DELAY * (attempt + 1))
         
-        # If we reach here, all attempts failed
-        if self.logger:
-            self.logger.error(f"Failed to click {element_desc} after {max_retries} attempts")
-        return False
+        if not clicked:
+            if self.logger:
+                self.logger.error(f"Failed to click {element_desc} after {max_retries} attempts")
+            return False
+        
+        # Wait for the caller's sign that the click registered, if given. The click already
+        # happened, so a timeout fails the call rather than clicking again (a second click
+        # would untick a checkbox or submit a link twice)
+        try:
+            if post_click_condition is not None:
+                self._get_wait(self.wait_time).until(post_click_condition)
+            if wait_for:
+                self._get_wait(self.wait_time).until(_css_condition("presence", wait_for))
+        except TimeoutException:
+            if self.logger:
+                self.logger.warning(f"Clicked {element_desc} but it did not take effect within {self.wait_time}s")
+            return False
+        return True
 
-    def input_text_with_wait(self, selector: str, text: str, element_name: str = "", press_enter: bool = False, clear_first: bool = True) -> bool:
+    def click_elements_bulk(self, selectors: List[str]) -> Dict[str, bool]:
+        """Click several elements in a single JavaScript call
+        
+        Meant for groups of checkboxes or toggles that are already rendered; unlike
+        click_element there is no waiting or retrying per element.
+        
+        Args:
+            selectors: CSS selectors of the elements to click, clicked in order
+            
+        Returns:
+            Dict mapping each selector to whether it was found and clicked
+        """
+        if not selectors:
+            return {}
+        
+        try:
+            results = self.driver.execute_script(_CLICK_ALL_JS, list(selectors)) or {}
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Bulk click failed: {str(e)}")
+            results = {}
+        return {selector: bool(results.get(selector)) for selector in selectors}
+
+    def extract_batch(self, row_selector: str, field_map: Dict[str, str]) -> List[Dict[str, Optional[str]]]:
+        """Extract fields from every row matching a selector in a single round trip
+        
+        Args:
+            row_selector: CSS selector for the rows (e.g. listing cards)
+            field_map: Field name to CSS selector inside the row. "selector@attr" reads
+                an attribute instead of the text (the DOM property when there is one, as
+                WebElement.get_attribute does); "@attr" reads it from the row itself
+            
+        Returns:
+            List[Dict[str, Optional[str]]]: One dict per row; fields that weren't found are None
+        """
+        fields = []
+        for field, spec in field_map.items():
+            selector, _, attribute = spec.partition('@')
+            fields.append([field, selector.strip(), attribute.strip()])
+        
+        try:
+            return self.driver.execute_script(_EXTRACT_BATCH_JS, row_selector, fields) or []
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error extracting rows for {row_selector}: {str(e)}")
+            return []
+    
+    def input_text_with_wait(self, selector_or_element, text: str, element_name: str = "", press_enter: bool = False,
+                             clear_first: bool = True, use_cdp_insert: bool = False) -> bool:
         """Input text into an element with wait and robust handling
         
         Args:
-            selector: The CSS selector for the element
+            selector_or_element: Either a CSS selector string or an already located WebElement
             text: Text to input
             element_name: Name of the element for logging (optional)
             press_enter: Whether to press Enter after inputting text
             clear_first: Whether to clear the input field first
+            use_cdp_insert: Try one CDP Input.insertText call before typing; it fires no
+                key events, so only use it for fields that don't listen for them
             
         Returns:
-            bool: True if input successful, False otherwise
+            bool: True if the field holds the text, False otherwise
         """
-        element_desc = element_name if element_name else selector
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.common.action_chains import ActionChains
+        from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
+        
+        element_desc = element_name if element_name else (
+            selector_or_element if isinstance(selector_or_element, str) else "element"
+        )
         
         try:
-            # First remove any overlays
-            self._remove_overlays()
-            # Quick delay after overlay removal
-            time.sleep(random.uniform(0.1, 0.2))
-            
             if self.logger:
                 self.logger.debug(f"Entering text in {element_desc}")
             
-            # Use smart wait for element to be clickable
-            if not self.smart_wait("clickable", selector, timeout=self.wait_time):
+            # Wait for the element to be interactable (this also scrolls it into view),
+            # unless the caller already holds it
+            if isinstance(selector_or_element, str):
+                element = self._locate_interactable(selector_or_element, self.wait_time)
+            else:
+                element = selector_or_element
+            if element is None:
                 if self.logger:
                     self.logger.error(f"Input element not clickable within timeout: {element_desc}")
                 return False
             
-            element = self.driver.find_element(By.CSS_SELECTOR, selector)
+            # Click to focus the element, sweeping fixed-position blockers if one is in the way
+            try:
+                element.click()
+            except ElementClickInterceptedException:
+                self._remove_overlays()
+                element.click()
+            
+            # Helpers to empty the field and to check it holds the text (ignoring formatting)
+            def clear_field():
+                element.clear()
+                # Double check it's cleared with JavaScript
+                self.driver.execute_script(_CLEAR_VALUE_JS, element)
+                self._get_wait(2).until(
+                    lambda driver: element.get_attribute('value') == ''
+                )
             
-            # Click to focus the element
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            element.click()
-            # Quick delay after click
-            time.sleep(random.uniform(0.05, 0.1))
+            def holds_text(driver):
+                value = driver.execute_script("return arguments[0].value;", element) or ''
+                return expected in _VALUE_FORMATTING_RE.sub('', value).lower()
             
             # Clear the field if requested
             if clear_first:
-                element.clear()
-                # Quick delay after clear
-                time.sleep(random.uniform(0.05, 0.1))
-                # Double check it's cleared with JavaScript
-                self.driver.execute_script("arguments[0].value = '';", element)
-                # Quick delay after JS clear
-                time.sleep(random.uniform(0.05, 0.1))
+                clear_field()
             
             # Try multiple methods to input text
-            try:
+            input_methods = [
                 # Method 1: Direct send_keys
-                element.send_keys(text)
-            except Exception:
+                lambda: element.send_keys(text),
+                # Method 2: Action chains
+                lambda: ActionChains(self.driver).move_to_element(element).click().send_keys(text).perform()
+            ]
+            if use_cdp_insert:
+                # Insert the whole string into the focused field in one CDP message (send_keys
+                # costs a command per character); it fires the input event but no key events
+                input_methods.insert(0, lambda: self.driver.execute_cdp_cmd('Input.insertText', {'text': text}))
+            
+            # Move on to the next method when one fails or leaves the field without the text
+            # (e.g. focus was lost); a field that can't be cleared is only tried once
+            expected = _VALUE_FORMATTING_RE.sub('', text).lower()
+            attempts = input_methods if clear_first else input_methods[:1]
+            for i, input_method in enumerate(attempts):
+                if i > 0:
+                    clear_field()
                 try:
-                    # Method 2: JavaScript value setting
-                    self.driver.execute_script("arguments[0].value = arguments[1];", element, text)
-                    # Trigger input event
-                    self.driver.execute_script("""
-                        var element = arguments[0];
-                        var event = new Event('input', { bubbles: true });
-                        element.dispatchEvent(event);
-                    """, element)
+                    input_method()
                 except Exception:
-                    # Method 3: Action chains
-                    ActionChains(self.driver).move_to_element(element).click().send_keys(text).perform()
+                    if i == len(attempts) - 1:  # If this was the last method
+                        raise
+                    continue
+                
+                # Wait for the field to hold the text instead of pausing a fixed time
+                try:
+                    self._get_wait(INPUT_SETTLE_TIMEOUT).until(holds_text)
+                    break
+                except TimeoutException:
+                    if self.logger:
+                        self.logger.debug(f"Value of {element_desc} doesn't match the entered text (method {i + 1})")
+            else:
+                if self.logger:
+                    self.logger.warning(f"{element_desc} did not take the entered text")
+                return False
             
             # Press Enter if requested
             if press_enter:
-                time.sleep(0.3)
                 element.send_keys(Keys.ENTER)
             
-            # Quick delay for input to register
-            time.sleep(random.uniform(0.1, 0.2))
             return True
             
         except Exception as e:
@@ -288,29 +1206,28 @@ class BaseScraper(ABC):
         Returns:
             bool: True if we're on the right page, False otherwise
         """
-        try:
-            # Use smart wait for page to load instead of fixed sleep
-            if not self.smart_wait("page_load", timeout=wait_time):
-                if self.logger:
-                    self.logger.warning(f"Page did not fully load within {wait_time} seconds")
-            
-            # Get current URL
-            current_url = self.driver.current_url.lower()
-            domain = domain.lower()
-            
-            # Check if we're on the right page
+        from selenium.common.exceptions import TimeoutException
+        
+        domain = domain.lower()
+        
+        def on_expected_page(driver):
+            current_url = driver.current_url.lower()
             is_match = (current_url == domain) if exact_match else (domain in current_url)
-            
-            if not is_match:
-                if self.logger:
-                    self.logger.error(f"Failed to reach {domain}. Current URL: {current_url}")
-                return False
+            return current_url if is_match else False
+        
+        try:
+            # Poll the URL and return as soon as it matches rather than waiting out wait_time
+            current_url = self._get_wait(wait_time).until(on_expected_page)
                 
             if self.logger:
                 self.logger.info(f"Successfully loaded page: {current_url}")
                 self.logger.info(f"Page title: {self.driver.title}")
                 
             return True
+        except TimeoutException:
+            if self.logger:
+                self.logger.error(f"Failed to reach {domain}. Current URL: {self.driver.current_url.lower()}")
+            return False
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error verifying page load: {str(e)}")
@@ -326,6 +1243,11 @@ class BaseScraper(ABC):
         if progress_callback:
             progress_callback(progress)
     
+    def _human_pause(self) -> None:
+        """Sleep a random time up to human_delay_jitter seconds (no-op at the default 0)"""
+        if self.human_delay_jitter > 0:
+            time.sleep(random.uniform(0, self.human_delay_jitter))
+    
     def smart_wait(self, 
                    condition_type: str = "presence", 
                    selector: str = None, 
@@ -333,7 +1255,8 @@ class BaseScraper(ABC):
                    min_count: int = 1,
                    timeout: int = 15,
                    stable_time: float = 1.0,
-                   human_delay: bool = True) -> bool:
+                   human_delay: bool = True,
+                   return_element: bool = False) -> Any:
         """Smart wait function that waits for specific conditions with dynamic timeouts
         
         Args:
@@ -344,59 +1267,69 @@ class BaseScraper(ABC):
                 - "count": Wait for a specific number of elements
                 - "min_count": Wait for at least min_count elements
                 - "stable": Wait for content to stabilize (no changes for stable_time)
-                - "page_load": Wait for page to finish loading
+                - "page_load": Wait for the document to be parsed (readyState "interactive")
+                - "network_idle": Wait until no fetch/XHR request is in flight and none has
+                  started or finished for stable_time
             selector: CSS selector for elements (required for most conditions)
             expected_count: Expected number of elements (for "count" condition)
             min_count: Minimum number of elements (for "min_count" condition)
             timeout: Maximum time to wait in seconds
-            stable_time: Time to wait for stability in seconds
-            human_delay: Whether to add small human-like delays
+            stable_time: Time to wait for stability (or network quiet) in seconds
+            human_delay: Whether to pause up to human_delay_jitter seconds after the wait
+            return_element: Return the located element instead of True for the
+                "presence", "visible" and "clickable" conditions
             
         Returns:
-            bool: True if condition was met, False if timeout occurred
+            bool: True if condition was met (or the WebElement with return_element),
+                False if timeout occurred
         """
-        start_time = time.time()
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
+        start_time = time.monotonic()
         
         if self.logger:
             self.logger.debug(f"Smart wait: {condition_type} for '{selector}' (timeout: {timeout}s)")
         
-        # Add initial human-like delay
-        if human_delay:
-            time.sleep(random.uniform(0.05, 0.1))
-        
         try:
             if condition_type == "page_load":
-                # Wait for page to finish loading
-                WebDriverWait(self.driver, timeout).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                # Wait for the DOM to be ready; "complete" additionally waits for images,
+                # fonts and trackers, which the scrapers never read (and partly block)
+                self._get_wait(timeout).until(
+                    lambda driver: self._cdp_eval("document.readyState") in ("interactive", "complete")
                 )
                 if human_delay:
-                    time.sleep(random.uniform(0.1, 0.2))
+                    self._human_pause()
                 return True
                 
-            elif condition_type == "presence":
-                WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            elif condition_type == "network_idle":
+                # Wait in the page for fetch/XHR requests to drain and go quiet (one round trip)
+                idle = self.driver.execute_async_script(
+                    _NETWORK_IDLE_JS, int(stable_time * 1000), int(timeout * 1000)
                 )
+                if not idle:
+                    raise TimeoutException()
                 if human_delay:
-                    time.sleep(random.uniform(0.05, 0.1))
+                    self._human_pause()
                 return True
                 
+            elif condition_type == "presence":
+                element = self._get_wait(timeout).until(_css_condition("presence", selector))
+                if human_delay:
+                    self._human_pause()
+                return element if return_element else True
+                
             elif condition_type == "visible":
-                WebDriverWait(self.driver, timeout).until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
-                )
+                element = self._get_wait(timeout).until(_css_condition("visible", selector))
                 if human_delay:
-                    time.sleep(random.uniform(0.05, 0.1))
-                return True
+                    self._human_pause()
+                return element if return_element else True
                 
             elif condition_type == "clickable":
-                WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                )
+                element = self._get_wait(timeout).until(_css_condition("clickable", selector))
                 if human_delay:
-                    time.sleep(random.uniform(0.05, 0.1))
-                return True
+                    self._human_pause()
+                return element if return_element else True
                 
             elif condition_type in ["count", "min_count"]:
                 # Wait for specific number of elements
@@ -410,39 +1343,58 @@ class BaseScraper(ABC):
                     else:  # min_count
                         return current_count >= target_count
                 
-                WebDriverWait(self.driver, timeout).until(count_condition)
+                self._get_wait(timeout).until(count_condition)
                 if human_delay:
-                    time.sleep(random.uniform(0.1, 0.2))
+                    self._human_pause()
                 return True
                 
             elif condition_type == "stable":
-                # Wait for content to stabilize (no changes for stable_time)
+                # Wait for content to stabilize (no changes for stable_time), counting in
+                # the page on each DOM mutation so the whole wait is one round trip
+                try:
+                    count = self.driver.execute_async_script(
+                        _WAIT_STABLE_JS, selector, int(stable_time * 1000), min_count, int(timeout * 1000)
+                    )
+                    if count is None:
+                        return False
+                    if self.logger:
+                        self.logger.debug(f"Content stabilized at {count} elements")
+                    if human_delay:
+                        self._human_pause()
+                    return True
+                except WebDriverException as e:
+                    if self.logger:
+                        self.logger.debug(f"In-page stable wait unavailable, polling instead: {str(e)}")
+                
                 last_count = 0
                 stable_start = None
+                interval = STABLE_POLL_MIN
                 
-                while time.time() - start_time < timeout:
+                while time.monotonic() - start_time < timeout:
                     try:
                         elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                         current_count = len(elements)
                         
                         if current_count == last_count and current_count >= min_count:
                             if stable_start is None:
-                                stable_start = time.time()
-                            elif time.time() - stable_start >= stable_time:
+                                stable_start = time.monotonic()
+                            elif time.monotonic() - stable_start >= stable_time:
                                 if self.logger:
                                     self.logger.debug(f"Content stabilized at {current_count} elements")
                                 if human_delay:
-                                    time.sleep(random.uniform(0.1, 0.2))
+                                    self._human_pause()
                                 return True
+                            # Nothing changed, so check less often
+                            interval = min(interval * 2, STABLE_POLL_MAX)
                         else:
                             stable_start = None
                             last_count = current_count
-                        
-                        time.sleep(0.1)  # Check every 100ms for faster response
+                            interval = STABLE_POLL_MIN
                         
                     except Exception:
-                        time.sleep(0.1)
-                        continue
+                        pass
+                    
+                    time.sleep(interval)
                 
                 return False
                 
@@ -458,16 +1410,16 @@ class BaseScraper(ABC):
         return False
 
     @abstractmethod
-    def search(self, property_types: List[str], location: str, min_price: str = None,
-              max_price: str = None, start_date: datetime = None, end_date: datetime = None,
+    def search(self, property_types: List[str], location: str, min_price: Optional[int] = None,
+              max_price: Optional[int] = None, start_date: datetime = None, end_date: datetime = None,
               progress_callback: Optional[Callable[[float], None]] = None) -> List[Dict[str, Any]]:
         """Search for listings with the given parameters
         
         Args:
             property_types: List of property types to search for
             location: Location to search in
-            min_price: Minimum price (optional)
-            max_price: Maximum price (optional)
+            min_price: Minimum price in whole dollars (optional)
+            max_price: Maximum price in whole dollars (optional)
             start_date: Start date for listings (optional)
             end_date: End date for listings (optional)
             progress_callback: Optional callback to report progress
@@ -1,20 +1,17 @@
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
-import time
 import re
 import logging
 import traceback
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-import random
 
 # Import the BaseScraper class
-from scraper.base_scraper import BaseScraper
+from scraper.base_scraper import BaseScraper, SUBMIT_FORM_JS
 from debug.logger import setup_logger, log_action
 
+# Seconds to wait for the location autocomplete suggestions (and again for the
+# network to settle if they can't be seen)
+LOCATION_SUGGESTION_TIMEOUT = 1.5
+
 class CommercialMLSScraper(BaseScraper):
     """Scraper for CommercialMLS.com property listings"""
     
@@ -33,6 +30,7 @@ class CommercialMLSScraper(BaseScraper):
             "search_button": "#content > div:nth-child(1) > div.row.mb-5.title-container > div > div > div.row.mt-3 > div:nth-child(1) > a",
             "location_dropdown": "#crroot > div > div.js-main-content > div:nth-child(1) > div:nth-child(1) > div > div > div:nth-child(1) > div:nth-child(1) > div",
             "location_input": "#crroot > div > div.js-main-content > div:nth-child(1) > div:nth-child(1) > div > div > div:nth-child(1) > div:nth-child(1) > div.dropdown.p2.rounded--bottom.js-dropdown > div > div:nth-child(1) > div.mb2.clearfix > div > input",
+            "location_suggestion": "div.js-dropdown li",
             "type_dropdown": "#crroot > div > div.js-main-content > div:nth-child(1) > div:nth-child(1) > div > div > div:nth-child(1) > div:nth-child(2) > div.p2.js-dropdown-toggle",
             "for_sale_checkbox": "#crroot > div > div.js-main-content > div:nth-child(1) > div:nth-child(1) > div > div > div:nth-child(1) > div:nth-child(2) > div.dropdown.p2.rounded--bottom.js-dropdown > div.grid-row > div.grid-column.span-6 > div.control-group > div:nth-child(1) > label > span.control-indicator",
             "multifamily_checkbox": "#crroot > div > div.js-main-content > div:nth-child(1) > div:nth-child(1) > div > div > div:nth-child(1) > div:nth-child(2) > div.dropdown.p2.rounded--bottom.js-dropdown > div.grid-row > div.grid-column.span-10.border--left > div > div:nth-child(9) > label > span.control-indicator",
@@ -63,8 +61,8 @@ class CommercialMLSScraper(BaseScraper):
             "retail": self.selectors["retail_checkbox"]
         }
     
-    def search(self, property_types: List[str], location: str, min_price: str = None,
-              max_price: str = None, start_date: datetime = None, end_date: datetime = None,
+    def search(self, property_types: List[str], location: str, min_price: Optional[int] = None,
+              max_price: Optional[int] = None, start_date: datetime = None, end_date: datetime = None,
               progress_callback: Optional[Callable[[float], None]] = None) -> List[Dict[str, Any]]:
         """Search for listings with the given parameters
         
@@ -80,10 +78,13 @@ class CommercialMLSScraper(BaseScraper):
         Returns:
             List of dictionaries containing listing details
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        
         results = []
         try:
-            # Set up the driver
-            self._setup_driver()
+            # Set up the driver, or reuse the one kept from the last search
+            self._ensure_driver()
             
             # Initialize progress
             self.update_progress(0.05, progress_callback)
@@ -141,13 +142,15 @@ class CommercialMLSScraper(BaseScraper):
             except Exception:
                 # If direct approach fails, try executing JavaScript to submit the form
                 self.logger.info("Using JavaScript to submit the search form")
-                self.driver.execute_script("document.querySelector('form').submit();")
+                if not self.driver.execute_script(SUBMIT_FORM_JS):
+                    self.logger.warning("No search form found to submit")
             
             # Update progress after submitting search
             self.update_progress(0.65, progress_callback)
             
-            # Wait for search results page to load completely
-            self.smart_wait("page_load", timeout=15)
+            # Wait for the search requests to finish; the results render in place, so
+            # document.readyState stays "complete" and can't signal this
+            self.smart_wait("network_idle", timeout=15, stable_time=0.5)
             
             # Update progress after initial results load
             self.update_progress(0.7, progress_callback)
@@ -192,13 +195,13 @@ class CommercialMLSScraper(BaseScraper):
             self.logger.error(f"Error during CommercialMLS search: {str(e)}")
             self.logger.error(traceback.format_exc())
         finally:
-            # Close the driver
-            self._close_driver()
+            # Close the driver (or keep it for the next search inside a with block)
+            self._finish_driver()
             
         return results
     
     def _setup_search_criteria(self, location: str, property_types: List[str], 
-                              min_price: str = None, max_price: str = None, 
+                              min_price: Optional[int] = None, max_price: Optional[int] = None, 
                               start_date: datetime = None,
                               progress_callback: Optional[Callable[[float], None]] = None) -> None:
         """Set up the search criteria on the website
@@ -211,25 +214,28 @@ class CommercialMLSScraper(BaseScraper):
             start_date: Start date for listings (optional)
             progress_callback: Optional callback to report progress
         """
+        from selenium.webdriver.common.keys import Keys
+        
         # Set location
         log_action(self.logger, f"Setting location to: {location}")
         if not self.click_element(self.selectors["location_dropdown"], "location dropdown"):
             return
 
-        # Wait for dropdown to open and input to become available
-        if not self.smart_wait("clickable", self.selectors["location_input"], timeout=10):
+        # Wait for dropdown to open and keep the input for typing and arrow key navigation
+        element = self.smart_wait("clickable", self.selectors["location_input"], timeout=10, return_element=True)
+        if not element:
             return
 
         # Enter location text
-        self.input_text_with_wait(self.selectors["location_input"], location, "location input")
+        self.input_text_with_wait(element, location, "location input")
 
-        # Get element reference for arrow key navigation
-        element = self.driver.find_element(By.CSS_SELECTOR, self.selectors["location_input"])
-
-        # Navigate to first suggestion and select it
-        time.sleep(random.uniform(0.1, 0.2))  # Wait for autocomplete
+        # Wait for the first autocomplete suggestion to show, then select it; if the list
+        # can't be seen, fall back to a short wait for the suggestion request to finish
+        # (both kept short so a selector that stops matching costs little per search)
+        if not self.smart_wait("visible", self.selectors["location_suggestion"], timeout=LOCATION_SUGGESTION_TIMEOUT):
+            self.logger.warning("Location suggestions did not appear, waiting for network idle")
+            self.smart_wait("network_idle", timeout=LOCATION_SUGGESTION_TIMEOUT, stable_time=0.2)
         element.send_keys(Keys.DOWN)
-        time.sleep(random.uniform(0.05, 0.1))
         element.send_keys(Keys.ENTER)
 
         # Update progress after confirming location
@@ -246,18 +252,23 @@ class CommercialMLSScraper(BaseScraper):
         # Update progress after selecting for sale
         self.update_progress(0.35, progress_callback)
         
-        # Select property types
+        # Select property types, all in one browser call, retrying any that weren't clicked
+        selected_types = {}
         for prop_type in property_types:
             prop_type = prop_type.lower()
             if prop_type in self.property_type_map:
                 log_action(self.logger, f"Selecting property type: {prop_type}")
-                self.click_element(self.property_type_map[prop_type], f"{prop_type} checkbox")
+                selected_types[self.property_type_map[prop_type]] = prop_type
+        
+        for selector, clicked in self.click_elements_bulk(list(selected_types)).items():
+            if not clicked:
+                self.click_element(selector, f"{selected_types[selector]} checkbox")
         
         # Update progress after setting property types
         self.update_progress(0.4, progress_callback)
         
         # Set price range if provided
-        if min_price or max_price:
+        if min_price is not None or max_price is not None:
             log_action(self.logger, "Setting price range filters")
             self.click_element(self.selectors["price_dropdown"], "price dropdown")
             
@@ -268,10 +279,10 @@ class CommercialMLSScraper(BaseScraper):
             self.update_progress(0.45, progress_callback)
             
             # Set min price if provided
-            if min_price:
+            if min_price is not None:
                 try:
                     log_action(self.logger, f"Setting minimum price: {min_price}")
-                    self.input_text_with_wait(self.selectors["min_price_input"], min_price, "minimum price input")
+                    self.input_text_with_wait(self.selectors["min_price_input"], str(min_price), "minimum price input")
                 except Exception as e:
                     self.logger.warning(f"Standard approach for min price failed: {str(e)}")
 
@@ -279,14 +290,14 @@ class CommercialMLSScraper(BaseScraper):
             self.update_progress(0.5, progress_callback)
 
             # Set max price if provided
-            if max_price:
+            if max_price is not None:
                 log_action(self.logger, f"Setting maximum price: {max_price}")
                 try:
-                    # Use the standardized method for input
-                    self.input_text_with_wait(self.selectors["max_price_input"], max_price, "maximum price input")
+                    # Use the standardized method for input, keeping the element for the tab key
+                    element = self._locate_interactable(self.selectors["max_price_input"], self.wait_time)
+                    self.input_text_with_wait(element, str(max_price), "maximum price input")
                     
                     # Send tab key to element to ensure value is applied
-                    element = self.driver.find_element(By.CSS_SELECTOR, self.selectors["max_price_input"])
                     element.send_keys(Keys.TAB)
                     
                 except Exception as e:
@@ -320,69 +331,53 @@ class CommercialMLSScraper(BaseScraper):
         processed_urls = set()
         
         try:
-            # Wait for grid listings to load
-            wait = WebDriverWait(self.driver, self.wait_time)
-            
-            # Wait for and get grid container
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.selectors["grid_container"])))
-            grid_container = self.driver.find_element(By.CSS_SELECTOR, self.selectors["grid_container"])
+            # Wait for the grid container
+            if not self.smart_wait("presence", self.selectors["grid_container"], timeout=self.wait_time):
+                self.logger.warning("Grid container not found")
+                return results
             
             # Wait for listing cards to fully load and stabilize - this is the critical fix
             self.logger.info("Waiting for listing cards to fully load and stabilize...")
             if not self.smart_wait("stable", self.selectors["listing_cards"], min_count=1, timeout=20, stable_time=2.0):
                 self.logger.warning("Listing cards did not stabilize within timeout, proceeding anyway")
             
-            # Find all listing cards within the grid
-            listing_cards = grid_container.find_elements(By.CSS_SELECTOR, self.selectors["listing_cards"])
-            
-            if not listing_cards:
+            # Read every card's fields in one browser call; the badge, name and price
+            # selectors are matched inside each card link, the URL is the link's own href
+            cards = self.extract_batch(
+                f'{self.selectors["grid_container"]} {self.selectors["listing_cards"]}',
+                {
+                    "property_type": self.selectors["property_type_badge"],
+                    "address": self.selectors["property_name"],
+                    "price": self.selectors["property_price"],
+                    "url": "@href"
+                }
+            )
+            
+            if not cards:
                 self.logger.warning("No listings found in grid view")
                 return results
             
-            self.logger.info(f"Found {len(listing_cards)} listings")
+            self.logger.info(f"Found {len(cards)} listings")
             
-            # Extract details from each listing card
-            for card in listing_cards:
-                try:
-                    listing = {}
-                    
-                    # Extract property type from the badge
-                    property_type_elem = card.find_element(By.CSS_SELECTOR, self.selectors["property_type_badge"])
-                    listing["property_type"] = property_type_elem.text.strip()
-                    
-                    # Extract name/address from the bold text
-                    name_elem = card.find_element(By.CSS_SELECTOR, self.selectors["property_name"])
-                    listing["address"] = name_elem.text.strip()
-                    
-                    # Extract price from the nested spans
-                    price_elem = card.find_element(By.CSS_SELECTOR, self.selectors["property_price"])
-                    listing["price"] = price_elem.text.strip()
-                    
-                    # Extract URL and convert to full property URL
-                    href = card.get_attribute("href")
-                    if href and href.startswith('#'):
-                        property_id = href.split('/')[-1]
-                        listing["url"] = f"https://www.commercialmls.com/property/{property_id}"
-                    else:
-                        listing["url"] = href
-                    
-                    # Skip if URL is invalid or duplicate
-                    if not listing["url"] or listing["url"] in processed_urls:
-                        continue
-                    
-                    processed_urls.add(listing["url"])
-                    
-                    # Add listing if it has valid information
-                    if all(listing.get(key) for key in ["property_type", "address", "price"]):
-                        results.append(listing)
-                        self.logger.debug(f"Added listing: {listing['address']} - {listing['price']}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error extracting listing: {str(e)}")
+            for listing in cards:
+                # Convert hash links to the full property URL
+                href = listing["url"]
+                if href and href.startswith('#'):
+                    property_id = href.split('/')[-1]
+                    listing["url"] = f"https://www.commercialmls.com/property/{property_id}"
+                
+                # Skip if URL is invalid or duplicate
+                if not listing["url"] or listing["url"] in processed_urls:
                     continue
+                
+                processed_urls.add(listing["url"])
+                
+                # Add listing if it has valid information
+                if all(listing.get(key) for key in ["property_type", "address", "price"]):
+                    results.append(listing)
+                    self.logger.debug(f"Added listing: {listing['address']} - {listing['price']}")
                     
         except Exception as e:
             self.logger.error(f"Error in grid extraction: {str(e)}")
         
         return results
-        
\ No newline at end of file
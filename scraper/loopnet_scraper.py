@@ -4,11 +4,14 @@ import time
 import logging
 import traceback
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
+import soupsieve
+
+# Parse result pages with lxml's C parser when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 from scraper.base_scraper import BaseScraper
 from debug.logger import setup_logger, log_action
@@ -45,6 +48,16 @@ class LoopNetScraper(BaseScraper):
         'details_link': "#placardSec > div.placards > ul > li > article > div.placard-pseudo > a, a[title*='More details for']"
     }
     
+    # Selector for the "More details" links that carry each listing's address and URL
+    DETAIL_LINK_SELECTOR = "a[title*='More details for']"
+    
+    # Selectors compiled once and reused for every card (soupsieve is bundled with beautifulsoup4)
+    COMPILED_LISTING_SELECTORS = {field: soupsieve.compile(selector) for field, selector in LISTING_SELECTORS.items()}
+    COMPILED_DETAIL_LINK_SELECTOR = soupsieve.compile(DETAIL_LINK_SELECTOR)
+    
+    # Price elements looked for around each detail link
+    COMPILED_PRICE_SELECTOR = soupsieve.compile("[name='Price'], [class*='price'], span.price, div.price")
+    
     def __init__(self, debug_mode: bool = False):
         """Initialize the LoopNet scraper
         
@@ -57,6 +70,8 @@ class LoopNetScraper(BaseScraper):
         
     def _try_close_popup(self) -> bool:
         """Try to close any popup that appears"""
+        from selenium.webdriver.common.by import By
+        
         try:
             # First try to remove overlays using JavaScript
             self._remove_overlays()
@@ -77,13 +92,13 @@ class LoopNetScraper(BaseScraper):
                 self.logger.debug(f"No popup to close: {str(e)}")
             return False
 
-    def search(self, property_types: List[str], location: str, min_price: str = None,
-              max_price: str = None, start_date: datetime = None, end_date: datetime = None,
+    def search(self, property_types: List[str], location: str, min_price: Optional[int] = None,
+              max_price: Optional[int] = None, start_date: datetime = None, end_date: datetime = None,
               progress_callback: Optional[Callable[[float], None]] = None) -> List[Dict[str, Any]]:
         """Search for listings with the given parameters"""
         try:
-            # Set up the driver
-            self._setup_driver()
+            # Set up the driver, or reuse the one kept from the last search
+            self._ensure_driver()
             
             # Initialize progress
             self.update_progress(0.05, progress_callback)
@@ -164,14 +179,14 @@ class LoopNetScraper(BaseScraper):
                 self.update_progress(0.4, progress_callback)
                 
                 # Set price range if provided
-                if min_price or max_price:
+                if min_price is not None or max_price is not None:
                     log_action(self.logger, "Setting price range filters")
                     
                     # Set min price if provided
-                    if min_price:
+                    if min_price is not None:
                         try:
                             log_action(self.logger, f"Setting minimum price: {min_price}")
-                            self.input_text_with_wait(self.SELECTORS['min_price_box'], min_price, "minimum price input", clear_first=True)
+                            self.input_text_with_wait(self.SELECTORS['min_price_box'], str(min_price), "minimum price input", clear_first=True)
                         except Exception as e:
                             self.logger.warning(f"Setting min price failed: {str(e)}")
                     
@@ -179,10 +194,10 @@ class LoopNetScraper(BaseScraper):
                     self.update_progress(0.45, progress_callback)
                     
                     # Set max price if provided
-                    if max_price:
+                    if max_price is not None:
                         try:
                             log_action(self.logger, f"Setting maximum price: {max_price}")
-                            self.input_text_with_wait(self.SELECTORS['max_price_box'], max_price, "maximum price input", clear_first=True)
+                            self.input_text_with_wait(self.SELECTORS['max_price_box'], str(max_price), "maximum price input", clear_first=True)
                         except Exception as e:
                             self.logger.warning(f"Setting max price failed: {str(e)}")
                     
@@ -212,9 +227,12 @@ class LoopNetScraper(BaseScraper):
                 self.logger.error(f"Error setting filters: {str(e)}")
                 self.logger.error(traceback.format_exc())
                 
-                # Try to close popup if there was an error
+                # Try to close popup if there was an error (usually there is none,
+                # so only look briefly instead of waiting out click_element's retries)
                 try:
-                    self.click_element(self.SELECTORS['popup_close_button'], "popup close button")
+                    close_button = self._short_find(self.SELECTORS['popup_close_button'])
+                    if close_button is not None:
+                        self.click_element(close_button, "popup close button")
                 except:
                     pass
             
@@ -241,40 +259,42 @@ class LoopNetScraper(BaseScraper):
             self.logger.error(f"Error during LoopNet search: {str(e)}")
             self.logger.error(traceback.format_exc())
         finally:
-            self._close_driver()
+            self._finish_driver()
         
         return results
     
-    def _extract_listing_details(self, card: Any, selectors: Dict[str, str]) -> Dict[str, str]:
-        """Extract listing details from a card element using provided selectors
+    def _extract_listings_columnar(self, cards: List[Any], selectors: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Extract listing details from many card elements as one column per field
+        
+        Each compiled selector runs across every card before moving to the next
+        field, so the result is filled a column at a time instead of building a
+        dict per card.
         
         Args:
-            card: The BeautifulSoup card element
-            selectors: Dictionary mapping field names to CSS selectors
+            cards: The BeautifulSoup card elements
+            selectors: Dictionary mapping field names to compiled soupsieve selectors
             
         Returns:
-            Dict[str, str]: Dictionary of extracted details
+            Dict[str, List[str]]: Field name to list of values, one entry per card
         """
-        details = {}
+        columns = {field: [f"{field} not available"] * len(cards) for field in selectors}
         for field, selector in selectors.items():
-            try:
-                element = card.select_one(selector)
-                if element:
-                    # Clean up the text
-                    text = element.text.strip()
-                    # Remove any extra whitespace
-                    text = ' '.join(text.split())
-                    details[field] = text
-                else:
-                    details[field] = f"{field} not available"
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"Error extracting {field}: {str(e)}")
-                details[field] = f"{field} not available"
-        return details
+            column = columns[field]
+            for i, card in enumerate(cards):
+                try:
+                    element = selector.select_one(card)
+                    if element:
+                        # Clean up the text and remove any extra whitespace
+                        column[i] = ' '.join(element.text.split())
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"Error extracting {field}: {str(e)}")
+        return columns
     
     def _extract_listings(self) -> List[Dict[str, Any]]:
         """Extract listing details from search results page"""
+        from selenium.webdriver.common.by import By
+        
         listings = []
         processed_urls = set()  # Track URLs to avoid duplicates
         log_action(self.logger, "Extracting listings")
@@ -285,7 +305,7 @@ class LoopNetScraper(BaseScraper):
             
             # Wait for listing elements to be present and stable
             self.logger.info("Waiting for listing content to stabilize...")
-            if not self.smart_wait("stable", "a[title*='More details for']", min_count=1, timeout=20, stable_time=2.0):
+            if not self.smart_wait("stable", self.DETAIL_LINK_SELECTOR, min_count=1, timeout=20, stable_time=2.0):
                 self.logger.warning("Listing content did not stabilize, trying alternative approach")
                 # Try waiting for placard containers as fallback
                 if not self.smart_wait("min_count", "div.placard-content, .property-card, article.placard", min_count=1, timeout=15):
@@ -293,12 +313,15 @@ class LoopNetScraper(BaseScraper):
             
             # Get the page source and parse with BeautifulSoup
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = BeautifulSoup(page_source, HTML_PARSER)
             
             # First try to find all listing links directly
-            detail_links = soup.select("a[title*='More details for']")
+            detail_links = self.COMPILED_DETAIL_LINK_SELECTOR.select(soup)
             log_action(self.logger, f"Found {len(detail_links)} detail links directly")
             
+            # Price found (or None) per ancestor element, keyed by id; soup keeps them alive
+            price_by_node = {}
+            
             for link in detail_links:
                 try:
                     if 'href' not in link.attrs:
@@ -331,10 +354,14 @@ class LoopNetScraper(BaseScraper):
                             if not parent:
                                 break
                                 
-                            # Look for price elements
-                            price_elem = parent.select_one("[name='Price'], [class*='price'], span.price, div.price")
-                            if price_elem and price_elem.text and '$' in price_elem.text:
-                                price = price_elem.text.strip()
+                            # Look for price elements; links on the same card share
+                            # ancestors, so each subtree is only searched once
+                            if id(parent) not in price_by_node:
+                                price_elem = self.COMPILED_PRICE_SELECTOR.select_one(parent)
+                                found = price_elem and price_elem.text and '$' in price_elem.text
+                                price_by_node[id(parent)] = price_elem.text.strip() if found else None
+                            if price_by_node[id(parent)]:
+                                price = price_by_node[id(parent)]
                                 break
                                 
                             parent = parent.parent
@@ -364,10 +391,13 @@ class LoopNetScraper(BaseScraper):
                     placard_contents = soup.select(".property-card, article.placard")
                     log_action(self.logger, f"Found {len(placard_contents)} alternative property cards")
                 
+                # Keep the cards that have a details link we haven't seen yet
+                cards = []
+                card_urls = []
                 for card in placard_contents:
                     try:
                         # Extract listing URL - look for any "More details" links
-                        links = card.select(self.LISTING_SELECTORS['details_link'])
+                        links = self.COMPILED_LISTING_SELECTORS['details_link'].select(card)
                         if not links:
                             continue
                             
@@ -382,28 +412,31 @@ class LoopNetScraper(BaseScraper):
                             continue
                             
                         processed_urls.add(listing_url)
-                        
-                        # Extract details using the class method
-                        details = self._extract_listing_details(card, self.LISTING_SELECTORS)
-                        
-                        # Combine address and location
-                        full_address = details['address']
-                        if full_address != "Address not available" and details['location']:
-                            full_address = f"{full_address}, {details['location']}"
-                        
-                        # Create listing
-                        listing = {
-                            'address': full_address,
-                            'price': details['price'],
-                            'property_type': details['property_type'],
-                            'url': listing_url
-                        }
-                        
-                        listings.append(listing)
-                        log_action(self.logger, f"Added listing from placard: {full_address}")
+                        cards.append(card)
+                        card_urls.append(listing_url)
                         
                     except Exception as e:
                         self.logger.error(f"Error extracting listing from placard: {str(e)}")
+                
+                # Extract each field across all cards at once
+                columns = self._extract_listings_columnar(cards, self.COMPILED_LISTING_SELECTORS)
+                
+                for i, listing_url in enumerate(card_urls):
+                    # Combine address and location
+                    full_address = columns['address'][i]
+                    if full_address != "Address not available" and columns['location'][i]:
+                        full_address = f"{full_address}, {columns['location'][i]}"
+                    
+                    # Create listing
+                    listing = {
+                        'address': full_address,
+                        'price': columns['price'][i],
+                        'property_type': columns['property_type'][i],
+                        'url': listing_url
+                    }
+                    
+                    listings.append(listing)
+                    log_action(self.logger, f"Added listing from placard: {full_address}")
             
             # Last resort - use Selenium to find elements
             if not listings and self.driver:
@@ -1,10 +1,61 @@
+import time
+import threading
 from typing import Dict, List, Any, Optional, Callable, Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from scraper.loopnet_scraper import LoopNetScraper
 from scraper.commercialmls_scraper import CommercialMLSScraper
 from debug.logger import setup_logger, log_action
 
+# Minimum seconds between progress callbacks forwarded for one site (caps UI updates at ~10 Hz)
+PROGRESS_MIN_INTERVAL = 0.1
+
+def throttle_progress(callback: Callable[[float], None],
+                      min_interval: float = PROGRESS_MIN_INTERVAL) -> Callable[[float], None]:
+    """Wrap a progress callback so bursts of updates are coalesced
+    
+    An update arriving within min_interval of the last forwarded one is held back;
+    only the latest held value is kept, and a timer forwards it once the interval
+    has passed, so the last value of a burst is never lost. Completion (1.0) is
+    always forwarded at once.
+    """
+    lock = threading.Lock()
+    state = {'last_sent': float('-inf'), 'pending': None, 'timer': None}
+    
+    def forward(progress: float) -> None:
+        # Called with the lock held, so updates reach the callback in order
+        state['last_sent'] = time.monotonic()
+        callback(progress)
+    
+    def flush() -> None:
+        with lock:
+            state['timer'] = None
+            progress, state['pending'] = state['pending'], None
+            if progress is not None:
+                forward(progress)
+    
+    def throttled(progress: float) -> None:
+        with lock:
+            wait = min_interval - (time.monotonic() - state['last_sent'])
+            if progress < 1.0 and wait > 0:
+                # Hold the latest value and make sure a flush is scheduled for it
+                state['pending'] = progress
+                if state['timer'] is None:
+                    state['timer'] = threading.Timer(wait, flush)
+                    state['timer'].daemon = True
+                    state['timer'].start()
+                return
+            
+            # Forwarding now supersedes any held value
+            if state['timer'] is not None:
+                state['timer'].cancel()
+                state['timer'] = None
+            state['pending'] = None
+            forward(progress)
+    
+    return throttled
+
 class ScraperManager:
     """Manages all real estate scrapers and coordinates searches."""
     
@@ -23,8 +74,8 @@ class ScraperManager:
             "commercialmls": CommercialMLSScraper(debug_mode=debug_mode)
         }
     
-    def search(self, property_types: List[str], location: str, min_price: str = None,
-              max_price: str = None, start_date: datetime = None, end_date: datetime = None,
+    def search(self, property_types: List[str], location: str, min_price: Optional[int] = None,
+              max_price: Optional[int] = None, start_date: datetime = None, end_date: datetime = None,
               websites: List[str] = None, 
               progress_callbacks: Dict[str, Callable[[float], None]] = None) -> Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
         """Execute search across specified or all scrapers
@@ -32,8 +83,8 @@ class ScraperManager:
         Args:
             property_types: List of property types to search for
             location: Location to search in
-            min_price: Minimum price (optional)
-            max_price: Maximum price (optional)
+            min_price: Minimum price in whole dollars (optional, see utils.search_utils.parse_price)
+            max_price: Maximum price in whole dollars (optional, see utils.search_utils.parse_price)
             start_date: Start date for listings (optional)
             end_date: End date for listings (optional)
             websites: List of websites to search on. If None, search all.
@@ -57,30 +108,49 @@ class ScraperManager:
         else:
             websites_to_search = self.scrapers
         
-        # Execute searches
-        for website_key, scraper in websites_to_search.items():
-            log_action(self.logger, f"Starting search on {website_key}")
-            
-            # Get progress callback for this website if available
-            progress_callback = None
-            if progress_callbacks and website_key in progress_callbacks:
-                progress_callback = progress_callbacks[website_key]
-            
-            # Execute search
-            website_results = scraper.search(
-                property_types=property_types,
-                location=location,
-                min_price=min_price,
-                max_price=max_price,
-                start_date=start_date,
-                end_date=end_date,
-                progress_callback=progress_callback
-            )
-            
-            results[website_key] = website_results
-            log_action(self.logger, f"Found {len(website_results)} results on {website_key}")
+        search_kwargs = dict(
+            property_types=property_types,
+            location=location,
+            min_price=min_price,
+            max_price=max_price,
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        # Execute searches. Each scraper drives its own browser and the work is
+        # dominated by waiting on the network, so sites are searched concurrently.
+        # Scrapers that hold their browser open until Enter is pressed run one at a
+        # time, so their console prompts don't interleave.
+        holds_on_exit = any(scraper.holds_on_exit() for scraper in websites_to_search.values())
+        if holds_on_exit or len(websites_to_search) <= 1:
+            for website_key, scraper in websites_to_search.items():
+                results[website_key] = self._search_site(website_key, scraper, progress_callbacks, search_kwargs)
+        else:
+            with ThreadPoolExecutor(max_workers=len(websites_to_search)) as executor:
+                futures = {
+                    website_key: executor.submit(self._search_site, website_key, scraper, progress_callbacks, search_kwargs)
+                    for website_key, scraper in websites_to_search.items()
+                }
+                for website_key, future in futures.items():
+                    results[website_key] = future.result()
         
         # Return list if single site, dict otherwise
         if single_site and len(results) == 1:
             return list(results.values())[0]
-        return results 
\ No newline at end of file
+        return results
+    
+    def _search_site(self, website_key: str, scraper, progress_callbacks: Optional[Dict[str, Callable[[float], None]]],
+                     search_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the search on a single website and return its results"""
+        log_action(self.logger, f"Starting search on {website_key}")
+        
+        # Get progress callback for this website if available
+        progress_callback = None
+        if progress_callbacks and website_key in progress_callbacks:
+            progress_callback = throttle_progress(progress_callbacks[website_key])
+        
+        # Execute search
+        website_results = scraper.search(progress_callback=progress_callback, **search_kwargs)
+        
+        log_action(self.logger, f"Found {len(website_results)} results on {website_key}")
+        return website_results 
\ No newline at end of file
@@ -11,7 +11,8 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from debug.logger import setup_logger
-from scraper.scraper_manager import ScraperManager
+from utils.file_utils import write_json_atomic
+from utils.search_utils import parse_price, total_count
 
 # Configuration constants
 if getattr(sys, 'frozen', False):
@@ -61,13 +62,13 @@ class TaskSchedulerManager:
     def execute_scraping(self):
         """Execute the scraping operation using configuration file - matches app.py run_scraper_directly logic"""
         try:
+            # Imported here so the GUI can load this module without pulling in Selenium
+            from scraper.scraper_manager import ScraperManager
+            
             logger.info("Starting scheduled scraping execution")
             
             # Load configuration using EXACT SAME logic as GUI for ALL modes
-            task_manager_file = os.path.abspath(__file__)
-            absolute_project_root = os.path.dirname(os.path.dirname(task_manager_file))
-            absolute_config_dir = os.path.join(absolute_project_root, "config")
-            absolute_config_file = os.path.join(absolute_config_dir, "config.json")
+            absolute_config_file = os.path.join(project_root, "config", "config.json")
             
             # Load user configuration
             user_config = None
@@ -86,27 +87,18 @@ class TaskSchedulerManager:
             logger.info(f"Loaded config: {user_config}")
             
             # Extract search parameters from config - matching app.py logic exactly
-            property_types = []
-            saved_types = user_config.get('property_types', [])
-            for prop_type in saved_types:
-                if prop_type == 'Office':
-                    property_types.append('office')
-                elif prop_type == 'Retail':
-                    property_types.append('retail')
-                elif prop_type == 'Industrial':
-                    property_types.append('industrial')
-                elif prop_type == 'Multifamily':
-                    property_types.append('multifamily')
-                else:
-                    property_types.append(prop_type.lower())
+            property_types = [prop_type.lower() for prop_type in user_config.get('property_types', [])]
             
             location = user_config.get('location', '').strip()
             
-            # Handle price range - ensure proper conversion from config strings
-            min_price_str = str(user_config.get('min_price', '')).strip()
-            max_price_str = str(user_config.get('max_price', '')).strip()
-            min_price = min_price_str if min_price_str else None
-            max_price = max_price_str if max_price_str else None
+            # Handle price range - parse the config strings into whole dollars once, and
+            # refuse to run rather than silently drop a price filter that can't be read
+            try:
+                min_price = parse_price(user_config.get('min_price'))
+                max_price = parse_price(user_config.get('max_price'))
+            except ValueError as e:
+                logger.error(f"Invalid price range in configuration: {str(e)}")
+                return False
             
             # Build websites list - matching what scraper_manager expects
             websites = user_config.get('websites', [])
@@ -147,15 +139,9 @@ class TaskSchedulerManager:
             )
             
             # Calculate total results - matching app.py logic
-            total_results = 0
-            if isinstance(results, dict):
-                for website, website_results in results.items():
-                    count = len(website_results) if website_results else 0
-                    total_results += count
-                    logger.info(f"Found {count} results on {website}")
-            else:
-                total_results = len(results) if results else 0
-                logger.info(f"Found {total_results} total results")
+            # Per-site counts are logged by ScraperManager
+            total_results = total_count(results)
+            logger.info(f"Found {total_results} total results")
             
             # Save to latest results file using same pattern as GUI
             os.makedirs(CONFIG_DIR, exist_ok=True)
@@ -167,8 +153,7 @@ class TaskSchedulerManager:
                 "trigger": "scheduled"
             }
             
-            with open(latest_results_file, 'w') as f:
-                json.dump(results_data, f, indent=2, default=str)
+            write_json_atomic(latest_results_file, results_data, separators=(',', ':'), default=str)
             logger.info(f"=== Scheduled scraping completed successfully! Total results: {total_results} ===")
             
             # Send email notification if enabled
@@ -200,7 +185,7 @@ class TaskSchedulerManager:
     def send_email_notification(self, results, total_results):
         """Send email notification for scheduled run results"""
         try:
-            from utils.email_sender import EmailSender
+            from utils.email_sender import EmailSender, format_email_body
             
             # Load configuration to check if email is enabled
             if os.path.exists(CONFIG_FILE):
@@ -226,50 +211,10 @@ class TaskSchedulerManager:
             subject = f"Commercial Real Estate Search Results - {total_results} Properties Found"
             
             # Create detailed email body (without emojis for better email compatibility)
-            email_body = f"""Commercial Real Estate Search Results
-=====================================
-
-Search completed: {run_time}
-Total properties found: {total_results}
-
-"""
-            
-            if total_results > 0:
-                # Handle both dict format {website: [listings]} and list format [listings]
-                if isinstance(results, dict):
-                    # Multiple websites format
-                    for website, website_results in results.items():
-                        if website_results and len(website_results) > 0:
-                            email_body += f"{'='*50}\n"
-                            email_body += f"{website.upper()} - {len(website_results)} Properties\n"
-                            email_body += f"{'='*50}\n\n"
-                            
-                            for i, listing in enumerate(website_results, 1):
-                                email_body += f"[{i}] "
-                                listing_details = self.format_listing_details(listing)
-                                email_body += "\n".join(listing_details)
-                                email_body += "\n\n" + "-"*40 + "\n\n"
-                elif isinstance(results, list):
-                    # Single website or combined results format
-                    email_body += f"{'='*50}\n"
-                    email_body += f"SEARCH RESULTS - {len(results)} Properties\n"
-                    email_body += f"{'='*50}\n\n"
-                    
-                    for i, listing in enumerate(results, 1):
-                        email_body += f"[{i}] "
-                        listing_details = self.format_listing_details(listing)
-                        email_body += "\n".join(listing_details)
-                        email_body += "\n\n" + "-"*40 + "\n\n"
-                else:
-                    email_body += f"Found {total_results} results but data format not recognized.\n"
-            else:
-                email_body += "No new properties found matching your criteria.\n"
-            
-            email_body += """
----
-This email was automatically sent by the Commercial Real Estate Crawler.
-To stop receiving these emails, uncheck 'Send email notifications' in the application.
-            """
+            email_body = format_email_body(
+                results, total_results, run_time,
+                lambda listing: "\n".join(self.format_listing_details(listing))
+            )
             
             # Send email
             email_sender = EmailSender()
@@ -3,6 +3,79 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
 
+# Line written between listings in a results body
+LISTING_SEPARATOR = "\n\n" + "-"*40 + "\n\n"
+
+# Footer appended to every results email
+EMAIL_FOOTER = """
+---
+This email was automatically sent by the Commercial Real Estate Crawler.
+To stop receiving these emails, uncheck 'Send email notifications' in the application.
+            """
+
+def format_results_body(results, total_results, format_listing):
+    """
+    Format the per-website listing sections of a results report
+
+    Args:
+        results (dict | list): Search results, {website: [listings]} or [listings]
+        total_results (int): Number of listings in results
+        format_listing (callable): Returns the text block for one listing
+
+    Returns:
+        str: The listing sections
+    """
+    # Collect the pieces and join once rather than growing one string per line
+    parts = []
+    
+    if total_results > 0:
+        # Handle both dict format {website: [listings]} and list format [listings]
+        if isinstance(results, dict):
+            # Multiple websites format
+            sections = [(website.upper(), website_results) for website, website_results in results.items()]
+        elif isinstance(results, list):
+            # Single website or combined results format
+            sections = [("SEARCH RESULTS", results)]
+        else:
+            sections = []
+            parts.append(f"Found {total_results} results but data format not recognized.\n")
+        
+        for heading, listings in sections:
+            if not listings:
+                continue
+            parts.append(f"{'='*50}\n{heading} - {len(listings)} Properties\n{'='*50}\n\n")
+            
+            for i, listing in enumerate(listings, 1):
+                parts.append(f"[{i}] ")
+                parts.append(format_listing(listing))
+                parts.append(LISTING_SEPARATOR)
+    else:
+        parts.append("No new properties found matching your criteria.\n")
+    
+    return "".join(parts)
+
+def format_email_body(results, total_results, run_time, format_listing):
+    """
+    Build the body of a results notification email
+
+    Args:
+        results (dict | list): Search results, {website: [listings]} or [listings]
+        total_results (int): Number of listings in results
+        run_time (str): When the search completed
+        format_listing (callable): Returns the text block for one listing (no emojis)
+
+    Returns:
+        str: The email body
+    """
+    return "".join((
+        "Commercial Real Estate Search Results\n",
+        "=====================================\n\n",
+        f"Search completed: {run_time}\n",
+        f"Total properties found: {total_results}\n\n",
+        format_results_body(results, total_results, format_listing),
+        EMAIL_FOOTER
+    ))
+
 class EmailSender:
     def __init__(self):
         self.smtp_server = "smtp.gmail.com"
@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+import time
+
+# Buffer size used when writing files
+WRITE_BUFFER_SIZE = 65536
+
+# Windows refuses to replace a file another process has open, so retry briefly
+REPLACE_ATTEMPTS = 3
+REPLACE_RETRY_DELAY = 0.1
+
+def write_text_atomic(path, text):
+    """
+    Write text to a file atomically
+
+    The text goes to a temporary file in the same directory which is then moved
+    over the destination with os.replace, so a crash mid-write never leaves a
+    truncated file and readers see either the old or the new contents.
+
+    Args:
+        path (str): Destination file path
+        text (str): File contents
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(text)
+
+        for attempt in range(REPLACE_ATTEMPTS):
+            try:
+                os.replace(tmp_path, path)
+                break
+            except PermissionError:
+                if attempt == REPLACE_ATTEMPTS - 1:
+                    raise
+                time.sleep(REPLACE_RETRY_DELAY)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """
+    Serialize data as JSON and write it to a file atomically
+
+    Args:
+        path (str): Destination file path
+        data: JSON-serializable data
+        **dump_kwargs: Extra arguments for json.dumps (indent, default, ...)
+    """
+    write_text_atomic(path, json.dumps(data, **dump_kwargs))
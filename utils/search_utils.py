@@ -0,0 +1,51 @@
+import math
+
+def parse_price(value):
+    """
+    Parse a price entered by the user (e.g. "$1,500,000.00") into whole dollars
+
+    Kept free of the scraper stack so the GUI can normalize saved prices without
+    loading Selenium or BeautifulSoup.
+
+    Args:
+        value (str | int | float | None): Price as typed in the configuration
+
+    Returns:
+        int | None: The price in whole dollars (cents dropped), or None if it is empty
+
+    Raises:
+        ValueError: If a non-empty value is not a non-negative number
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid price: {value!r}")
+    if isinstance(value, (int, float)):
+        price = value
+    else:
+        digits = str(value).strip().lstrip('$').replace(',', '').replace(' ', '')
+        if not digits:
+            return None
+        try:
+            price = float(digits)
+        except ValueError:
+            raise ValueError(f"Invalid price: {value!r}")
+    
+    # Numbers from the configuration get the same checks as typed text
+    if price < 0 or not math.isfinite(price):
+        raise ValueError(f"Invalid price: {value!r}")
+    return int(price)
+
+def total_count(results):
+    """
+    Count the listings in a search result
+
+    Args:
+        results (dict | list | None): Per-site dict {website: [listings]} or a single-site list
+
+    Returns:
+        int: Number of listings
+    """
+    if isinstance(results, dict):
+        return sum(map(len, filter(None, results.values())))
+    return len(results) if results else 0